@@ -5,20 +5,27 @@ Search for skills using AI-powered semantic search on SkillsMP marketplace.
 """
 
 import argparse
-import json
 import sys
-from typing import Optional
+from typing import Optional, TextIO
 
-from utils import APIRequestError, SkillsMPError, make_api_request
+from utils import (
+    APIRequestError,
+    SkillsMPError,
+    ensure_utf8_output,
+    make_api_request,
+    print_json,
+    truncate_text,
+)
 
 
-def ai_search(query: str, api_key: Optional[str] = None) -> dict:
+def ai_search(query: str, api_key: Optional[str] = None, use_cache: bool = True) -> dict:
     """
     Search skills using AI semantic search.
 
     Args:
         query: Natural language search query
         api_key: SkillsMP API key
+        use_cache: Reuse a recently cached response if available (default: True)
 
     Returns:
         dict: Search results
@@ -27,24 +34,32 @@ def ai_search(query: str, api_key: Optional[str] = None) -> dict:
         SkillsMPError: If the search fails
     """
     params = {"q": query}
-    return make_api_request("/skills/ai-search", params, api_key=api_key)
+    return make_api_request("/skills/ai-search", params, api_key=api_key, use_cache=use_cache)
 
 
-def format_results(results):
-    """Format search results for display"""
+def format_results(results, file: Optional[TextIO] = None):
+    """
+    Format search results for display.
+
+    Args:
+        results: API response from the search
+        file: Stream to write to (default: the current sys.stdout)
+    """
     if not results.get("success", True):
         error = results.get("error", {})
-        print(f"Error: {error.get('code', 'UNKNOWN')} - {error.get('message', 'Unknown error')}")
+        print(
+            f"Error: {error.get('code', 'UNKNOWN')} - {error.get('message', 'Unknown error')}",
+            file=file,
+        )
         return
 
     data = results.get("data", {})
     skills = data.get("skills", [])
 
-    print(f"\n=== AI Search Results ===\n")
+    lines = ["\n=== AI Search Results ===\n"]
 
     if not skills:
-        print("No skills found matching your query.")
-        return
+        lines.append("No skills found matching your query.")
 
     for i, skill in enumerate(skills, 1):
         name = skill.get("name", "Unknown")
@@ -53,27 +68,34 @@ def format_results(results):
         stars = skill.get("stars", 0)
         author = skill.get("author", "Unknown")
 
-        print(f"{i}. {name}")
-        print(f"   Author: {author} | Stars: {stars} | Relevance: {relevance:.2f}")
-        print(f"   Description: {description[:100]}{'...' if len(description) > 100 else ''}")
-        print()
+        lines.append(f"{i}. {name}")
+        lines.append(f"   Author: {author} | Stars: {stars} | Relevance: {relevance:.2f}")
+        lines.append(f"   Description: {truncate_text(description)}")
+        lines.append("")
+
+    print("\n".join(lines), file=file)
 
 
 def main():
+    ensure_utf8_output()
+
     parser = argparse.ArgumentParser(
         description="AI-powered semantic search on SkillsMP marketplace"
     )
     parser.add_argument("query", help="Natural language search query")
     parser.add_argument("--json", action="store_true", help="Output raw JSON")
     parser.add_argument("--api-key", help="API key (overrides file)")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass cached results and query the API"
+    )
 
     args = parser.parse_args()
 
     try:
-        results = ai_search(query=args.query, api_key=args.api_key)
+        results = ai_search(query=args.query, api_key=args.api_key, use_cache=not args.no_cache)
 
         if args.json:
-            print(json.dumps(results, indent=2))
+            print_json(results)
         else:
             format_results(results)
 
@@ -5,22 +5,37 @@ Check for updates to installed skills by comparing local file times with SkillsM
 """
 
 import argparse
-import json
-import re
+import itertools
+import math
+import os
 import sys
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+import skill_diff
+import skill_downloader
 from utils import (
     APIRequestError,
     SkillsMPError,
+    batched_cache_writes,
+    ensure_utf8_output,
     get_claude_skills_dir,
     load_api_key,
     make_api_request,
+    print_json,
 )
 
+# Maximum number of SkillsMP lookups in flight during an update check
+MAX_CONCURRENT_LOOKUPS = 8
+# Number of threads used to scan the local skills directory
+MAX_SCAN_WORKERS = 16
+# Seconds before a skill is looked up on SkillsMP again (use --force to bypass)
+UPDATE_CHECK_CACHE_TTL = 3600
+# Skills modified more recently than this many seconds are assumed current
+DEFAULT_MIN_AGE = 3600
+
 
 def get_skill_name_from_md(skill_md_path: Path) -> Optional[str]:
     """
@@ -32,75 +47,90 @@ def get_skill_name_from_md(skill_md_path: Path) -> Optional[str]:
     Returns:
         Skill name or None if not found
     """
-    try:
-        with open(skill_md_path, "r", encoding="utf-8") as f:
-            content = f.read()
+    # Same parser as skill_diff, so both always agree on a skill's name
+    return skill_diff.extract_frontmatter(skill_md_path).get("name")
+
+
+def _scan_skill_dir(entry: os.DirEntry) -> Optional[Dict[str, Any]]:
+    """
+    Extract metadata for one entry of the skills directory.
 
-            # Extract name from YAML frontmatter
-            match = re.search(r"^name:\s*(.+)$", content, re.MULTILINE)
-            if match:
-                return match.group(1).strip()
-    except Exception:
-        pass
-    return None
+    Args:
+        entry: Directory entry of a candidate skill directory
+
+    Returns:
+        Dict with skill metadata, or None if the entry is not an installed skill
+    """
+    # DirEntry caches file type (and stat on Windows) from the directory listing
+    if not entry.is_dir():
+        return None
+
+    skill_md = os.path.join(entry.path, "SKILL.md")
+    if not os.path.isfile(skill_md):
+        return None
+
+    skill_name = get_skill_name_from_md(Path(skill_md))
+    if not skill_name:
+        return None
+
+    # Get directory modification time as Unix timestamp
+    local_mtime = entry.stat().st_mtime
+
+    return {
+        "name": skill_name,
+        "path": Path(entry.path),
+        "local_modified": local_mtime,
+        "local_modified_date": format_timestamp(local_mtime),
+    }
 
 
 def get_installed_skills_with_metadata(skills_dir: Path) -> List[Dict]:
     """
     Scan local skills directory and extract metadata.
 
+    Entries are scanned on a thread pool so that slow filesystems (network
+    mounts, WSL) can service several stat/read calls at once.
+
     Args:
         skills_dir: Path to Claude skills directory
 
     Returns:
         List of dicts with skill metadata: name, path, local_modified
     """
-    skills: List[Dict[str, Any]] = []
-
     if not skills_dir.exists():
-        return skills
-
-    for skill_dir in skills_dir.iterdir():
-        if not skill_dir.is_dir():
-            continue
-
-        skill_md = skill_dir / "SKILL.md"
-        if not skill_md.exists():
-            continue
-
-        skill_name = get_skill_name_from_md(skill_md)
-        if not skill_name:
-            continue
+        return []
 
-        # Get directory modification time as Unix timestamp
-        local_mtime = skill_dir.stat().st_mtime
+    with os.scandir(skills_dir) as it:
+        entries = list(it)
 
-        skills.append(
-            {
-                "name": skill_name,
-                "path": skill_dir,
-                "local_modified": local_mtime,
-                "local_modified_date": datetime.fromtimestamp(local_mtime).strftime("%Y-%m-%d"),
-            }
-        )
+    with ThreadPoolExecutor(max_workers=MAX_SCAN_WORKERS) as executor:
+        scanned = executor.map(_scan_skill_dir, entries)
+        return [skill for skill in scanned if skill is not None]
 
-    return skills
 
-
-def search_skill_on_skillsmp(skill_name: str, api_key: Optional[str] = None) -> Optional[Dict]:
+def search_skill_on_skillsmp(
+    skill_name: str, api_key: Optional[str] = None, use_cache: bool = True
+) -> Optional[Dict]:
     """
     Search for a skill on SkillsMP marketplace.
 
     Args:
         skill_name: Name of the skill to search for
         api_key: SkillsMP API key
+        use_cache: Reuse a lookup made within UPDATE_CHECK_CACHE_TTL (default: True)
 
     Returns:
         Skill data from API or None if not found
     """
     try:
         params = {"q": skill_name, "limit": 5, "sortBy": "stars"}
-        result = make_api_request("/skills/search", params, api_key=api_key)
+        result = make_api_request(
+            "/skills/search",
+            params,
+            api_key=api_key,
+            use_cache=use_cache,
+            cache_ttl=UPDATE_CHECK_CACHE_TTL,
+        )
 
         if not result.get("success"):
             return None
@@ -109,33 +139,140 @@ def search_skill_on_skillsmp(skill_name: str, api_key: Optional[str] = None) ->
         if not skills_list:
             return None
 
-        # Find exact match by name
-        for skill in skills_list:
-            if skill.get("name", "").lower() == skill_name.lower():
-                return skill
-
-        # If no exact match, return first result (best match)
-        return skills_list[0]
+        # Find exact match by name, else return first result (best match)
+        target = skill_name.lower()
+        return next((s for s in skills_list if s.get("name", "").lower() == target), skills_list[0])
 
     except (APIRequestError, SkillsMPError):
         return None
 
 
-def format_timestamp(unix_timestamp: int) -> str:
-    """Convert Unix timestamp to readable date."""
-    return datetime.fromtimestamp(unix_timestamp).strftime("%Y-%m-%d")
+def search_skills_on_skillsmp(
+    skill_names: List[str],
+    api_key: Optional[str] = None,
+    use_cache: bool = True,
+    on_result: Optional[Callable[[str, Optional[Dict]], None]] = None,
+) -> Dict[str, Optional[Dict]]:
+    """
+    Look up several skills on SkillsMP in one batch.
 
+    Names are matched case-insensitively, so each distinct name is searched
+    only once. Lookups run concurrently, at most MAX_CONCURRENT_LOOKUPS at a time.
 
-def check_skill_updates(skills_dir: Optional[Path] = None, api_key: Optional[str] = None) -> Dict:
+    Args:
+        skill_names: Names of the skills to search for
+        api_key: SkillsMP API key
+        use_cache: Reuse lookups made within UPDATE_CHECK_CACHE_TTL (default: True)
+        on_result: Called in the calling thread with each lowercased name and its
+            skill data as soon as that lookup completes
+
+    Returns:
+        Dict mapping each lowercased skill name to its skill data (None if not found)
+    """
+    unique_names = list({name.lower(): name for name in skill_names}.values())
+    if not unique_names:
+        return {}
+
+    remote_skills: Dict[str, Optional[Dict]] = {}
+    max_workers = min(MAX_CONCURRENT_LOOKUPS, len(unique_names))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                search_skill_on_skillsmp, name, api_key=api_key, use_cache=use_cache
+            ): name.lower()
+            for name in unique_names
+        }
+        for future in as_completed(futures):
+            key = futures[future]
+            remote_skills[key] = future.result()
+            if on_result is not None:
+                on_result(key, remote_skills[key])
+    return remote_skills
+
+
+def parse_remote_timestamp(value: Any) -> float:
+    """
+    Normalize a SkillsMP updatedAt value to a Unix timestamp.
+
+    Args:
+        value: updatedAt from the API (number, numeric string, or missing)
+
+    Returns:
+        Timestamp in seconds, or 0.0 if the value is missing or not a finite number
+    """
+    try:
+        timestamp = float(value)
+    except (TypeError, ValueError):
+        return 0.0
+    return timestamp if math.isfinite(timestamp) else 0.0
+
+
+def format_timestamp(unix_timestamp: float) -> str:
+    """Convert Unix timestamp to readable date (local time)."""
+    # Formatting the struct_time fields directly skips datetime and locale-aware strftime
+    t = time.localtime(unix_timestamp)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+
+
+def _classify_skill(
+    skill: Dict[str, Any], remote_skill: Optional[Dict]
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Compare an installed skill with its SkillsMP entry and print the outcome.
+
+    Args:
+        skill: Installed skill metadata from get_installed_skills_with_metadata()
+        remote_skill: Skill data from SkillsMP, or None if it was not found
+
+    Returns:
+        Tuple of the check_skill_updates() result key and the entry to add to it
+    """
+    if not remote_skill:
+        print("❓ Not found on SkillsMP")
+        return "not_found", skill
+
+    # Extract remote data
+    remote_updated = parse_remote_timestamp(remote_skill.get("updatedAt"))
+    remote_updated_date = format_timestamp(remote_updated)
+    local_mtime = skill["local_modified"]
+
+    # Compare timestamps (allow 1 second tolerance for file system precision)
+    if remote_updated > local_mtime + 1:
+        print(f"⚠️ Update available!")
+        print(f"   Local: {skill['local_modified_date']} | Remote: {remote_updated_date}")
+        return "updates", {
+            "name": skill["name"],
+            "local_date": skill["local_modified_date"],
+            "remote_date": remote_updated_date,
+            "local_timestamp": local_mtime,
+            "remote_timestamp": remote_updated,
+            "github_url": remote_skill.get("githubUrl", ""),
+            "skill_url": remote_skill.get("skillUrl", ""),
+            "stars": remote_skill.get("stars", 0),
+        }
+
+    print("✅ Up to date")
+    return "up_to_date", skill
+
+
+def check_skill_updates(
+    skills_dir: Optional[Path] = None,
+    api_key: Optional[str] = None,
+    force: bool = False,
+    min_age: float = DEFAULT_MIN_AGE,
+) -> Dict:
     """
     Check all installed skills for available updates.
 
     Args:
         skills_dir: Custom skills directory
         api_key: API key for SkillsMP API
+        force: Query SkillsMP even for skills checked or modified within the last hour
+        min_age: Skip the lookup for skills modified less than this many seconds ago
 
     Returns:
-        Dict with 'updates', 'up_to_date', 'not_found', 'errors' lists
+        Dict with 'updates', 'up_to_date', 'skipped', 'not_found', 'errors' lists;
+        'skipped' holds skills newer than min_age, which were not checked remotely
     """
     if skills_dir is None:
         skills_dir = get_claude_skills_dir()
@@ -145,6 +282,7 @@ def check_skill_updates(skills_dir: Optional[Path] = None, api_key: Optional[str
     result: Dict[str, List[Any]] = {
         "updates": [],  # Skills with remote updates
         "up_to_date": [],  # Skills that are current
+        "skipped": [],  # Recently modified skills that were not looked up
         "not_found": [],  # Skills not found on SkillsMP
         "errors": [],  # Skills that had errors
     }
@@ -152,55 +290,44 @@ def check_skill_updates(skills_dir: Optional[Path] = None, api_key: Optional[str
     if not installed_skills:
         return result
 
-    print(f"🔍 Checking {len(installed_skills)} installed skills for updates...\n")
+    total = len(installed_skills)
+    print(f"🔍 Checking {total} installed skills for updates...\n")
 
-    for i, skill in enumerate(installed_skills, 1):
-        skill_name = skill["name"]
-        local_mtime = skill["local_modified"]
+    # Outcomes are printed as lookups finish but collected in scan order
+    outcomes: Dict[int, Tuple[str, Dict[str, Any]]] = {}
+    progress = itertools.count(1)
 
-        # Show progress
-        print(f"[{i}/{len(installed_skills)}] Checking {skill_name}...", end=" ")
+    def show_progress(skill: Dict[str, Any]) -> None:
+        print(f"[{next(progress)}/{total}] {skill['name']}...", end=" ")
 
-        # Search on SkillsMP
-        remote_skill = search_skill_on_skillsmp(skill_name, api_key=api_key)
-
-        if not remote_skill:
-            print("❓ Not found on SkillsMP")
-            result["not_found"].append(skill)
-            # Add small delay to avoid rate limiting
-            time.sleep(0.3)
+    # Skills installed or updated moments ago cannot have a newer remote version yet
+    now = time.time()
+    pending: Dict[str, List[int]] = {}
+    for index, skill in enumerate(installed_skills):
+        if force or now - skill["local_modified"] >= min_age:
+            pending.setdefault(skill["name"].lower(), []).append(index)
             continue
+        show_progress(skill)
+        print("⏭️ Recently modified, not checked")
+        outcomes[index] = ("skipped", skill)
+
+    def report(name: str, remote_skill: Optional[Dict]) -> None:
+        for index in pending[name]:
+            show_progress(installed_skills[index])
+            outcomes[index] = _classify_skill(installed_skills[index], remote_skill)
+
+    # One cache load and one store for the whole scan rather than one per skill
+    with batched_cache_writes():
+        search_skills_on_skillsmp(
+            [installed_skills[indexes[0]]["name"] for indexes in pending.values()],
+            api_key=api_key,
+            use_cache=not force,
+            on_result=report,
+        )
 
-        # Extract remote data
-        remote_updated = remote_skill.get("updatedAt", 0)
-        remote_updated_date = format_timestamp(remote_updated)
-        github_url = remote_skill.get("githubUrl", "")
-        skill_url = remote_skill.get("skillUrl", "")
-        stars = remote_skill.get("stars", 0)
-
-        # Compare timestamps (allow 1 second tolerance for file system precision)
-        if remote_updated > local_mtime + 1:
-            print(f"⚠️ Update available!")
-            print(f"   Local: {skill['local_modified_date']} | Remote: {remote_updated_date}")
-            result["updates"].append(
-                {
-                    "name": skill_name,
-                    "local_date": skill["local_modified_date"],
-                    "remote_date": remote_updated_date,
-                    "local_timestamp": local_mtime,
-                    "remote_timestamp": remote_updated,
-                    "github_url": github_url,
-                    "skill_url": skill_url,
-                    "stars": stars,
-                }
-            )
-        else:
-            print("✅ Up to date")
-            result["up_to_date"].append(skill)
-
-        # Add small delay to avoid rate limiting
-        time.sleep(0.3)
-
+    for index in range(total):
+        key, entry = outcomes[index]
+        result[key].append(entry)
     return result
 
 
@@ -208,46 +335,46 @@ def format_update_summary(result: Dict):
     """Format and display update check results."""
     updates = result["updates"]
     up_to_date = result["up_to_date"]
+    skipped = result["skipped"]
     not_found = result["not_found"]
     errors = result["errors"]
 
-    print("\n" + "=" * 60)
-    print("📊 UPDATE CHECK SUMMARY")
-    print("=" * 60)
+    lines = ["\n" + "=" * 60, "📊 UPDATE CHECK SUMMARY", "=" * 60]
 
     # Show updates
     if updates:
-        print(f"\n⚠️ {len(updates)} skill(s) with potential updates:\n")
+        lines.append(f"\n⚠️ {len(updates)} skill(s) with potential updates:\n")
         for i, update in enumerate(updates, 1):
-            print(f"{i}. {update['name']}")
-            print(f"   Local: {update['local_date']} | SkillsMP: {update['remote_date']}")
-            print(f"   Stars: {update['stars']}")
-            print(f"   GitHub: {update['github_url']}")
-            print()
+            lines.append(f"{i}. {update['name']}")
+            lines.append(f"   Local: {update['local_date']} | SkillsMP: {update['remote_date']}")
+            lines.append(f"   Stars: {update['stars']}")
+            lines.append(f"   GitHub: {update['github_url']}")
+            lines.append("")
     else:
-        print("\n✨ No updates found - all checked skills are up to date!\n")
+        lines.append("\n✨ No updates found - all checked skills are up to date!\n")
 
     # Show not found
     if not_found:
-        print(f"❓ {len(not_found)} skill(s) not found on SkillsMP:")
-        for skill in not_found:
-            print(f"   - {skill['name']}")
-        print()
+        lines.append(f"❓ {len(not_found)} skill(s) not found on SkillsMP:")
+        lines.extend(f"   - {skill['name']}" for skill in not_found)
+        lines.append("")
 
     # Show errors
     if errors:
-        print(f"❌ {len(errors)} skill(s) had errors:")
-        for error in errors:
-            print(f"   - {error['name']}: {error['error']}")
-        print()
+        lines.append(f"❌ {len(errors)} skill(s) had errors:")
+        lines.extend(f"   - {error['name']}: {error['error']}" for error in errors)
+        lines.append("")
 
     # Show summary
     total_checked = len(updates) + len(up_to_date)
-    print(f"Total checked: {total_checked}")
-    print(f"Up to date: {len(up_to_date)}")
-    print(f"Updates available: {len(updates)}")
-    print(f"Not found: {len(not_found)}")
-    print(f"Errors: {len(errors)}")
+    lines.append(f"Total checked: {total_checked}")
+    lines.append(f"Up to date: {len(up_to_date)}")
+    lines.append(f"Skipped (recently modified): {len(skipped)}")
+    lines.append(f"Updates available: {len(updates)}")
+    lines.append(f"Not found: {len(not_found)}")
+    lines.append(f"Errors: {len(errors)}")
+
+    print("\n".join(lines))
 
 
 def interactive_details_loop(result: Dict, api_key: Optional[str] = None):
@@ -286,15 +413,8 @@ def interactive_details_loop(result: Dict, api_key: Optional[str] = None):
             skill_name = selected["name"]
             github_url = selected["github_url"]
 
-            # Import skill_diff to show details
-            import subprocess
-
             print(f"\n🔍 Fetching details for {skill_name}...")
-            subprocess.run(
-                ["python", "skill_diff.py", skill_name],
-                cwd=Path(__file__).parent,
-                capture_output=False,
-            )
+            skill_diff.show_skill_diff(skill_name, api_key=api_key)
 
             # Ask if user wants to update
             print("\n" + "=" * 60)
@@ -307,16 +427,13 @@ def interactive_details_loop(result: Dict, api_key: Optional[str] = None):
                 continue
 
             if update_choice in ("", "y", "yes"):
-                # Import and run skill_downloader
                 print(f"\n📦 Updating {skill_name}...")
 
-                update_result = subprocess.run(
-                    ["python", "skill_downloader.py", skill_name, "--github-url", github_url],
-                    cwd=Path(__file__).parent,
-                    capture_output=False,
+                updated = skill_downloader.install_skill_update(
+                    skill_name, github_url=github_url, api_key=api_key
                 )
 
-                if update_result.returncode == 0:
+                if updated:
                     print(f"\n✅ {skill_name} updated successfully!")
                 else:
                     print(f"\n❌ {skill_name} update failed")
@@ -333,9 +450,20 @@ def interactive_details_loop(result: Dict, api_key: Optional[str] = None):
 
 
 def main():
+    ensure_utf8_output()
+
     parser = argparse.ArgumentParser(description="Check SkillsMP skills for available updates")
     parser.add_argument("--json", action="store_true", help="Output results in JSON format")
     parser.add_argument("--api-key", help="API key (overrides file)")
+    parser.add_argument(
+        "--force", action="store_true", help="Check all skills even if recently checked"
+    )
+    parser.add_argument(
+        "--min-age",
+        type=int,
+        default=DEFAULT_MIN_AGE,
+        help="Skip skills modified less than this many seconds ago (default: 3600, 0 checks all)",
+    )
     parser.add_argument(
         "--no-interactive",
         action="store_true",
@@ -345,7 +473,7 @@ def main():
     args = parser.parse_args()
 
     try:
-        result = check_skill_updates(api_key=args.api_key)
+        result = check_skill_updates(api_key=args.api_key, force=args.force, min_age=args.min_age)
 
         if args.json:
             # Convert to JSON-serializable format
@@ -355,10 +483,11 @@ def main():
                     {"name": s["name"], "local_date": s["local_modified_date"]}
                     for s in result["up_to_date"]
                 ],
+                "skipped": [s["name"] for s in result["skipped"]],
                 "not_found": [s["name"] for s in result["not_found"]],
                 "errors": result["errors"],
             }
-            print(json.dumps(json_result, indent=2))
+            print_json(json_result)
         else:
             format_update_summary(result)
 
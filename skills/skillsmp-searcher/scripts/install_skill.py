@@ -7,9 +7,10 @@ Install skills from SkillsMP marketplace with one command.
 import argparse
 import json
 import sys
+from pathlib import Path
 
 import search_skills
-from utils import install_skill, install_skill_from_url, list_installed_skills
+from utils import ensure_utf8_output, install_skill, install_skill_from_url, list_installed_skills
 
 
 def install_from_search_results(skill_index: int, search_query: str, **search_kwargs):
@@ -39,14 +40,15 @@ def install_from_search_results(skill_index: int, search_query: str, **search_kw
         sys.exit(1)
 
     # Display search results
-    print(f"Found {data.get('total', 0)} skills:\n")
+    lines = [f"Found {data.get('total', 0)} skills:\n"]
     for i, skill in enumerate(skills, 1):
         name = skill.get("name", "Unknown")
         author = skill.get("author", "Unknown")
         stars = skill.get("stars", 0)
-        print(f"{i}. {name} by {author} (⭐ {stars})")
+        lines.append(f"{i}. {name} by {author} (⭐ {stars})")
+    lines.append("")
 
-    print()
+    print("\n".join(lines))
 
     # Validate index
     if skill_index < 1 or skill_index > len(skills):
@@ -77,8 +79,6 @@ def install_from_search_results(skill_index: int, search_query: str, **search_kw
             installed_path = install_skill_from_url(skill_url)
         else:
             # Assume it's a local path
-            from pathlib import Path
-
             installed_path = install_skill(Path(skill_url))
 
         print(f"\n✅ Successfully installed: {skill_name}")
@@ -91,6 +91,8 @@ def install_from_search_results(skill_index: int, search_query: str, **search_kw
 
 
 def main():
+    ensure_utf8_output()
+
     parser = argparse.ArgumentParser(description="Install skills from SkillsMP marketplace")
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
@@ -132,8 +134,6 @@ def main():
             ):
                 # Direct installation from URL or file
                 print(f"📦 Installing from: {args.query}\n")
-                from pathlib import Path
-
                 if args.query.startswith("http"):
                     installed_path = install_skill_from_url(args.query)
                 else:
@@ -5,11 +5,17 @@ Search for skills using keywords on SkillsMP marketplace.
 """
 
 import argparse
-import json
 import sys
-from typing import Optional
+from typing import Optional, TextIO
 
-from utils import APIRequestError, SkillsMPError, make_api_request
+from utils import (
+    APIRequestError,
+    SkillsMPError,
+    ensure_utf8_output,
+    make_api_request,
+    print_json,
+    truncate_text,
+)
 
 
 def search_skills(
@@ -18,6 +24,7 @@ def search_skills(
     limit: int = 20,
     sort_by: str = "stars",
     api_key: Optional[str] = None,
+    use_cache: bool = True,
 ) -> dict:
     """
     Search skills using keyword search.
@@ -28,6 +35,7 @@ def search_skills(
         limit: Items per page (default: 20, max: 100)
         sort_by: Sort by 'stars' or 'recent' (default: 'stars')
         api_key: SkillsMP API key
+        use_cache: Reuse a recently cached response if available (default: True)
 
     Returns:
         dict: Search results
@@ -36,14 +44,23 @@ def search_skills(
         SkillsMPError: If the search fails
     """
     params = {"q": query, "page": page, "limit": min(limit, 100), "sortBy": sort_by}
-    return make_api_request("/skills/search", params, api_key=api_key)
+    return make_api_request("/skills/search", params, api_key=api_key, use_cache=use_cache)
 
 
-def format_results(results):
-    """Format search results for display"""
+def format_results(results, file: Optional[TextIO] = None):
+    """
+    Format search results for display.
+
+    Args:
+        results: API response from the search
+        file: Stream to write to (default: the current sys.stdout)
+    """
     if not results.get("success", True):
         error = results.get("error", {})
-        print(f"Error: {error.get('code', 'UNKNOWN')} - {error.get('message', 'Unknown error')}")
+        print(
+            f"Error: {error.get('code', 'UNKNOWN')} - {error.get('message', 'Unknown error')}",
+            file=file,
+        )
         return
 
     data = results.get("data", {})
@@ -54,8 +71,7 @@ def format_results(results):
     if total == 0 and len(skills) > 0:
         total = len(skills)
 
-    print(f"\n=== Search Results ===")
-    print(f"Total: {total} skills found\n")
+    lines = ["\n=== Search Results ===", f"Total: {total} skills found\n"]
 
     for i, skill in enumerate(skills, 1):
         name = skill.get("name", "Unknown")
@@ -63,13 +79,17 @@ def format_results(results):
         stars = skill.get("stars", 0)
         author = skill.get("author", "Unknown")
 
-        print(f"{i}. {name}")
-        print(f"   Author: {author} | Stars: {stars}")
-        print(f"   Description: {description[:100]}{'...' if len(description) > 100 else ''}")
-        print()
+        lines.append(f"{i}. {name}")
+        lines.append(f"   Author: {author} | Stars: {stars}")
+        lines.append(f"   Description: {truncate_text(description)}")
+        lines.append("")
+
+    print("\n".join(lines), file=file)
 
 
 def main():
+    ensure_utf8_output()
+
     parser = argparse.ArgumentParser(description="Search SkillsMP marketplace for skills")
     parser.add_argument("query", help="Search keyword")
     parser.add_argument("--page", type=int, default=1, help="Page number (default: 1)")
@@ -84,6 +104,9 @@ def main():
     )
     parser.add_argument("--json", action="store_true", help="Output raw JSON")
     parser.add_argument("--api-key", help="API key (overrides file)")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Bypass cached results and query the API"
+    )
 
     args = parser.parse_args()
 
@@ -94,10 +117,11 @@ def main():
             limit=args.limit,
             sort_by=args.sort,
             api_key=args.api_key,
+            use_cache=not args.no_cache,
         )
 
         if args.json:
-            print(json.dumps(results, indent=2))
+            print_json(results)
         else:
             format_results(results)
 
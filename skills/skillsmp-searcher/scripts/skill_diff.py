@@ -5,19 +5,34 @@ Compare local skill with remote SkillsMP version.
 """
 
 import argparse
-import json
+import functools
+import itertools
+import os
 import re
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-from utils import APIRequestError, SkillsMPError, make_api_request
+from utils import (
+    APIRequestError,
+    SkillsMPError,
+    ensure_utf8_output,
+    get_claude_skills_dir,
+    make_api_request,
+    print_json,
+)
+
+# Lines of SKILL.md scanned for frontmatter if its closing --- never appears
+FRONTMATTER_MAX_LINES = 200
+_FIELD_RE = re.compile(r"(\w+):[ \t]*(.+)")
 
 
 def extract_frontmatter(skill_md_path: Path) -> Dict[str, str]:
     """
     Extract YAML frontmatter from SKILL.md.
 
+    Parsed results are reused until the file's size or modification time changes.
+
     Args:
         skill_md_path: Path to SKILL.md file
 
@@ -25,29 +40,33 @@ def extract_frontmatter(skill_md_path: Path) -> Dict[str, str]:
         Dict with frontmatter fields
     """
     try:
-        with open(skill_md_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        st = os.stat(skill_md_path)
+    except OSError:
+        return {}
+    return dict(_read_frontmatter(str(skill_md_path), st.st_mtime_ns, st.st_size))
 
-            frontmatter = {}
-            in_frontmatter = False
 
-            for line in content.split("\n")[:30]:  # Check first 30 lines
+@functools.lru_cache(maxsize=256)
+def _read_frontmatter(path: str, mtime_ns: int, size: int) -> Dict[str, str]:
+    """Parse the frontmatter of a SKILL.md file, memoized on its stat signature."""
+    frontmatter: Dict[str, str] = {}
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            # Stop reading at the closing delimiter; the body is never needed
+            in_frontmatter = False
+            for line in itertools.islice(f, FRONTMATTER_MAX_LINES):
                 if line.strip() == "---":
-                    if not in_frontmatter:
-                        in_frontmatter = True
-                    else:
+                    if in_frontmatter:
                         break
-                    continue
-
-                if in_frontmatter:
-                    match = re.match(r"^(\w+):\s*(.+)$", line)
+                    in_frontmatter = True
+                elif in_frontmatter:
+                    match = _FIELD_RE.match(line)
                     if match:
                         key, value = match.groups()
                         frontmatter[key] = value.strip()
-
-            return frontmatter
-    except Exception:
+    except OSError:
         return {}
+    return frontmatter
 
 
 def get_skill_details_from_skillsmp(
@@ -74,13 +93,9 @@ def get_skill_details_from_skillsmp(
         if not skills_list:
             return None
 
-        # Find exact match
-        for skill in skills_list:
-            if skill.get("name", "").lower() == skill_name.lower():
-                return skill
-
-        # Return best match
-        return skills_list[0]
+        # Find exact match by name, else return first result (best match)
+        target = skill_name.lower()
+        return next((s for s in skills_list if s.get("name", "").lower() == target), skills_list[0])
 
     except (APIRequestError, SkillsMPError):
         return None
@@ -129,10 +144,12 @@ def compare_versions(local: Dict[str, str], remote: Dict[str, Any]) -> Dict[str,
         differences["author_changed"] = True
         fields_list.append({"field": "author", "local": local_author, "remote": remote_author})
 
-    # Compare stars (always check, not in frontmatter)
-    remote_stars = remote.get("stars", 0)
-    differences["stars_changed"] = True
-    fields_list.append({"field": "stars", "remote": remote_stars})
+    # Compare stars (rarely in frontmatter; the remote count is shown in the header anyway)
+    local_stars = local.get("stars", "")
+    remote_stars = remote.get("stars")
+    if local_stars and remote_stars is not None and local_stars != str(remote_stars):
+        differences["stars_changed"] = True
+        fields_list.append({"field": "stars", "local": local_stars, "remote": remote_stars})
 
     return differences
 
@@ -141,44 +158,127 @@ def format_diff_output(
     skill_name: str, local_path: Path, remote_data: Dict[str, Any], differences: Dict[str, Any]
 ):
     """Format and display diff comparison."""
-    print("\n" + "=" * 60)
-    print(f"📦 {skill_name} - Version Comparison")
-    print("=" * 60)
-
-    # Basic info
-    print(f"\n📍 Local Path: {local_path}")
-    print(f"🔗 GitHub: {remote_data.get('githubUrl', 'N/A')}")
-    print(f"🌐 SkillsMP: {remote_data.get('skillUrl', 'N/A')}")
-    print(f"⭐ Stars: {remote_data.get('stars', 0)}")
-    print(f"📅 Last Updated: {remote_data.get('updatedAt', 'N/A')} " f"(Unix timestamp)")
+    lines = [
+        "\n" + "=" * 60,
+        f"📦 {skill_name} - Version Comparison",
+        "=" * 60,
+        # Basic info
+        f"\n📍 Local Path: {local_path}",
+        f"🔗 GitHub: {remote_data.get('githubUrl', 'N/A')}",
+        f"🌐 SkillsMP: {remote_data.get('skillUrl', 'N/A')}",
+        f"⭐ Stars: {remote_data.get('stars', 0)}",
+        f"📅 Last Updated: {remote_data.get('updatedAt', 'N/A')} (Unix timestamp)",
+    ]
 
     # Differences
     if differences["fields"]:
-        print("\n📋 Changes Detected:\n")
+        lines.append("\n📋 Changes Detected:\n")
 
         for field_data in differences["fields"]:
             field = field_data["field"]
-            if field == "name":
-                print(f"  Name:")
-                print(f"    - Local:  {field_data['local']}")
-                print(f"    + Remote: {field_data['remote']}")
-            elif field == "description":
-                print(f"  Description:")
-                print(f"    - Local:  {field_data['local']}...")
-                print(f"    + Remote: {field_data['remote']}...")
-            elif field == "author":
-                print(f"  Author:")
-                print(f"    - Local:  {field_data['local']}")
-                print(f"    + Remote: {field_data['remote']}")
-            elif field == "stars":
-                print(f"  Stars: {field_data['remote']}")
+            # Descriptions are truncated by compare_versions
+            suffix = "..." if field == "description" else ""
+            lines.append(f"  {field.capitalize()}:")
+            lines.append(f"    - Local:  {field_data['local']}{suffix}")
+            lines.append(f"    + Remote: {field_data['remote']}{suffix}")
     else:
-        print("\n✅ No differences detected in frontmatter")
+        lines.append("\n✅ No differences detected in frontmatter")
+
+    lines.append("\n" + "=" * 60)
+    print("\n".join(lines))
+
+
+def find_local_skill(skill_name: str, skill_dir: Path) -> Optional[Path]:
+    """
+    Find the installed skill whose frontmatter name matches skill_name.
+
+    Skills are usually installed in a directory named after them, so that
+    directory is checked first and the full scan only runs if it does not match.
+
+    Args:
+        skill_name: Name of the skill (case-insensitive)
+        skill_dir: Skills directory to search
+
+    Returns:
+        Path to the skill directory, or None if the skill is not installed
+    """
+    target = skill_name.lower()
+
+    def matches(item: Path) -> bool:
+        return extract_frontmatter(item / "SKILL.md").get("name", "").lower() == target
 
-    print("\n" + "=" * 60)
+    candidate = skill_dir / skill_name
+    if candidate.is_dir() and matches(candidate):
+        return candidate
+
+    # DirEntry.is_dir() is usually answered from the directory listing without a stat call
+    with os.scandir(skill_dir) as it:
+        for entry in it:
+            if entry.name != skill_name and entry.is_dir() and matches(Path(entry.path)):
+                return Path(entry.path)
+    return None
+
+
+def show_skill_diff(
+    skill_name: str,
+    skill_dir: Optional[Path] = None,
+    api_key: Optional[str] = None,
+    as_json: bool = False,
+) -> bool:
+    """
+    Compare an installed skill with its SkillsMP version and display the result.
+
+    Args:
+        skill_name: Name of the skill to compare
+        skill_dir: Custom skills directory (if None, uses default Claude location)
+        api_key: SkillsMP API key
+        as_json: Print the comparison as JSON instead of formatted text
+
+    Returns:
+        True if the comparison was shown, False if the skill was not found
+        locally or on SkillsMP
+    """
+    if skill_dir is None:
+        skill_dir = get_claude_skills_dir()
+
+    local_skill_path = find_local_skill(skill_name, skill_dir)
+    if not local_skill_path:
+        print(f"❌ Skill '{skill_name}' not found locally")
+        return False
+
+    # Get remote data
+    remote_data = get_skill_details_from_skillsmp(skill_name, api_key=api_key)
+
+    if not remote_data:
+        print(f"❌ Skill '{skill_name}' not found on SkillsMP")
+        return False
+
+    # Extract local frontmatter
+    skill_md = local_skill_path / "SKILL.md"
+    local_frontmatter = extract_frontmatter(skill_md)
+
+    # Compare
+    differences = compare_versions(local_frontmatter, remote_data)
+
+    if as_json:
+        # Output JSON
+        json_output = {
+            "skill_name": skill_name,
+            "local_path": str(local_skill_path),
+            "remote_data": remote_data,
+            "differences": differences,
+        }
+        print_json(json_output)
+    else:
+        # Format output
+        format_diff_output(skill_name, local_skill_path, remote_data, differences)
+
+    return True
 
 
 def main():
+    ensure_utf8_output()
+
     parser = argparse.ArgumentParser(description="Compare local skill with SkillsMP remote version")
     parser.add_argument("skill_name", help="Name of the skill to compare")
     parser.add_argument(
@@ -192,56 +292,12 @@ def main():
     args = parser.parse_args()
 
     try:
-        # Determine skill directory
-        skill_dir = args.skill_dir
-        if not skill_dir:
-            from utils import get_claude_skills_dir
-
-            skill_dir = get_claude_skills_dir()
-
-        # Find local skill directory
-        local_skill_path = None
-        for item in skill_dir.iterdir():
-            if item.is_dir():
-                skill_md = item / "SKILL.md"
-                if skill_md.exists():
-                    # Extract name from frontmatter
-                    frontmatter = extract_frontmatter(skill_md)
-                    if frontmatter.get("name", "").lower() == args.skill_name.lower():
-                        local_skill_path = item
-                        break
-
-        if not local_skill_path:
-            print(f"❌ Skill '{args.skill_name}' not found locally")
-            sys.exit(1)
-
-        # Get remote data
-        remote_data = get_skill_details_from_skillsmp(args.skill_name, api_key=args.api_key)
-
-        if not remote_data:
-            print(f"❌ Skill '{args.skill_name}' not found on SkillsMP")
+        found = show_skill_diff(
+            args.skill_name, skill_dir=args.skill_dir, api_key=args.api_key, as_json=args.json
+        )
+        if not found:
             sys.exit(1)
 
-        # Extract local frontmatter
-        skill_md = local_skill_path / "SKILL.md"
-        local_frontmatter = extract_frontmatter(skill_md)
-
-        # Compare
-        differences = compare_versions(local_frontmatter, remote_data)
-
-        if args.json:
-            # Output JSON
-            json_output = {
-                "skill_name": args.skill_name,
-                "local_path": str(local_skill_path),
-                "remote_data": remote_data,
-                "differences": differences,
-            }
-            print(json.dumps(json_output, indent=2))
-        else:
-            # Format output
-            format_diff_output(args.skill_name, local_skill_path, remote_data, differences)
-
     except SkillsMPError as e:
         print(f"❌ Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -9,40 +9,49 @@ import os
 import re
 import shutil
 import sys
-import tempfile
 import zipfile
 from pathlib import Path
-from typing import Optional
+from typing import IO, List, Optional
 
 import requests
+
+import skill_diff
 from utils import (
     APIRequestError,
     SkillsMPError,
+    download_file,
+    download_to_buffer,
+    ensure_utf8_output,
     get_claude_skills_dir,
-    install_skill,
+    install_skill_archive,
     load_api_key,
     make_api_request,
+    url_exists,
 )
 
+# Owner and repository of a GitHub URL
+_GITHUB_URL_RE = re.compile(r"github\.com/([^/]+)/([^/]+)")
 
-def infer_download_url(github_url: str, skill_name: str) -> Optional[str]:
+
+def candidate_download_urls(github_url: str, skill_name: str) -> List[str]:
     """
-    Infer download URL from GitHub URL.
+    List the GitHub Releases URLs a skill archive is likely published under.
 
-    Attempts to construct GitHub Releases download URL.
+    No requests are made; infer_download_url probes these in order.
 
     Args:
         github_url: GitHub repository URL
         skill_name: Name of the skill
 
     Returns:
-        Download URL or None if cannot be inferred
+        Candidate download URLs, most likely first (empty if github_url is not a
+        GitHub repository URL)
     """
     # Extract owner/repo from GitHub URL
     # Format: https://github.com/owner/repo/tree/branch/skills/skill-name
-    match = re.search(r"github\.com/([^/]+)/([^/]+)", github_url)
+    match = _GITHUB_URL_RE.search(github_url)
     if not match:
-        return None
+        return []
 
     owner, repo = match.groups()
 
@@ -54,9 +63,30 @@ def infer_download_url(github_url: str, skill_name: str) -> Optional[str]:
         f"{owner}-{repo}.skill",
     ]
 
-    for filename in possible_filenames:
-        download_url = f"https://github.com/{owner}/{repo}/releases/latest/download/{filename}"
-        return download_url
+    # dict.fromkeys drops repeats (e.g. skill named after its repo) but keeps the order
+    return [
+        f"https://github.com/{owner}/{repo}/releases/latest/download/{filename}"
+        for filename in dict.fromkeys(possible_filenames)
+    ]
+
+
+def infer_download_url(github_url: str, skill_name: str) -> Optional[str]:
+    """
+    Infer download URL from GitHub URL.
+
+    Probes the likely GitHub Releases asset names with HEAD requests and
+    returns the first one that exists.
+
+    Args:
+        github_url: GitHub repository URL
+        skill_name: Name of the skill
+
+    Returns:
+        Download URL or None if no release asset could be found
+    """
+    for download_url in candidate_download_urls(github_url, skill_name):
+        if url_exists(download_url):
+            return download_url
 
     return None
 
@@ -74,38 +104,57 @@ def download_skill_file(download_url: str, dest_path: Path) -> bool:
     """
     try:
         print(f"📥 Downloading from: {download_url}")
-        response = requests.get(download_url, stream=True, timeout=30)
+        download_file(download_url, dest_path)
+        print(f"✅ Downloaded to: {dest_path}")
+        return True
 
-        if response.status_code == 404:
-            print("❌ Download failed: File not found (404)")
-            return False
+    except requests.exceptions.RequestException as e:
+        _report_download_error(e)
+        return False
 
-        response.raise_for_status()
 
-        # Download to file
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(dest_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+def download_skill_archive(download_url: str) -> Optional[IO[bytes]]:
+    """
+    Download a skill file from URL into memory.
 
-        print(f"✅ Downloaded to: {dest_path}")
-        return True
+    Args:
+        download_url: URL to download from
+
+    Returns:
+        File object holding the archive (the caller closes it), or None if the
+        download failed
+    """
+    try:
+        print(f"📥 Downloading from: {download_url}")
+        archive = download_to_buffer(download_url)
+        print("✅ Download complete")
+        return archive
 
     except requests.exceptions.RequestException as e:
-        print(f"❌ Download failed: {e}")
-        return False
+        _report_download_error(e)
+        return None
+
+
+def _report_download_error(error: requests.exceptions.RequestException):
+    """Print why a download failed."""
+    if error.response is not None and error.response.status_code == 404:
+        print("❌ Download failed: File not found (404)")
+    else:
+        print(f"❌ Download failed: {error}")
 
 
 def backup_skill_directory(skill_dir: Path) -> Optional[Path]:
     """
-    Create backup of existing skill directory.
+    Move an existing skill directory aside as a backup.
+
+    The directory is renamed to a sibling, which is a cheap metadata operation;
+    shutil.move only falls back to copying if the rename is not possible.
 
     Args:
         skill_dir: Path to skill directory
 
     Returns:
-        Backup directory path or None if failed
+        Backup directory path or None if failed (skill_dir is then left in place)
     """
     try:
         parent = skill_dir.parent
@@ -117,11 +166,11 @@ def backup_skill_directory(skill_dir: Path) -> Optional[Path]:
             shutil.rmtree(backup_path)
 
         # Create backup
-        shutil.copytree(skill_dir, backup_path)
+        shutil.move(str(skill_dir), str(backup_path))
         print(f"📦 Backup created: {backup_path}")
         return backup_path
 
-    except Exception as e:
+    except OSError as e:
         print(f"⚠️  Warning: Could not create backup: {e}")
         return None
 
@@ -152,17 +201,7 @@ def install_skill_update(
         skills_dir = get_claude_skills_dir()
 
     # Find existing skill directory
-    skill_dir = None
-    for item in skills_dir.iterdir():
-        if item.is_dir() and (item / "SKILL.md").exists():
-            # Extract name from frontmatter
-            import skill_diff
-
-            frontmatter = skill_diff.extract_frontmatter(item / "SKILL.md")
-            if frontmatter.get("name", "").lower() == skill_name.lower():
-                skill_dir = item
-                break
-
+    skill_dir = skill_diff.find_local_skill(skill_name, skills_dir)
     if not skill_dir:
         print(f"❌ Skill '{skill_name}' not found locally")
         return False
@@ -176,67 +215,85 @@ def install_skill_update(
         print("   Please provide --download-url or --github-url")
         return False
 
-    # Create backup
-    backup_path = None
-    if backup:
-        backup_path = backup_skill_directory(skill_dir)
-
-    # Download to temp directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir) / "downloaded.skill"
-        if not download_skill_file(download_url, temp_path):
-            return False
+    # Download into memory rather than writing a temporary file and reading it back
+    archive = download_skill_archive(download_url)
+    if archive is None:
+        return False
 
-        # Verify it's a valid zip file (skill package)
+    with archive:
+        # Verify it's a valid zip file (skill package); the same ZipFile is used to install
         try:
-            with zipfile.ZipFile(temp_path, "r") as zip_ref:
-                namelist = zip_ref.namelist()
-                if not namelist:
-                    print("❌ Invalid skill file: empty archive")
-                    return False
+            zip_ref = zipfile.ZipFile(archive, "r")
         except zipfile.BadZipFile:
             print("❌ Invalid skill file: not a valid zip archive")
             return False
 
-        # Remove existing installation
+        with zip_ref:
+            if not zip_ref.namelist():
+                print("❌ Invalid skill file: empty archive")
+                return False
+
+            return _replace_skill(zip_ref, skill_name, skill_dir, skills_dir, backup)
+
+
+def _replace_skill(
+    zip_ref: zipfile.ZipFile, skill_name: str, skill_dir: Path, skills_dir: Path, backup: bool
+) -> bool:
+    """
+    Swap an installed skill for the contents of an opened archive.
+
+    The old installation is moved aside (or removed when backup is False) and
+    restored if installing the new version fails.
+
+    Returns:
+        True if successful, False otherwise
+    """
+    # Move the existing installation aside as a backup, or remove it
+    backup_path = backup_skill_directory(skill_dir) if backup else None
+    if backup_path is None:
         try:
             shutil.rmtree(skill_dir)
-        except Exception as e:
+        except OSError as e:
             print(f"⚠️  Warning: Could not remove old installation: {e}")
-            # Try to remove backup and restore
-            if backup_path and backup_path.exists():
-                shutil.rmtree(backup_path)
             return False
 
-        # Install new version
-        try:
-            installed_path = install_skill(temp_path, skills_dir=skills_dir)
-            print(f"✅ Successfully updated: {skill_name}")
-            print(f"   Location: {installed_path}")
-
-            # Remove backup on success
-            if backup_path and backup_path.exists():
-                shutil.rmtree(backup_path)
-                print("🗑️  Backup removed (update successful)")
+    # Install new version
+    try:
+        installed_path = install_skill_archive(zip_ref, skills_dir=skills_dir)
+    except (SkillsMPError, OSError) as e:
+        print(f"❌ Installation failed: {e}")
+
+        # Restore from backup
+        if backup_path and backup_path.exists():
+            print(f"🔄 Restoring from backup...")
+            try:
+                # Clear out anything a partial install left behind
+                if skill_dir.exists():
+                    shutil.rmtree(skill_dir)
+                shutil.move(str(backup_path), str(skill_dir))
+                print("✅ Successfully restored from backup")
+            except OSError as restore_error:
+                print(f"❌ Could not restore backup: {restore_error}")
 
-            return True
+        return False
 
-        except Exception as e:
-            print(f"❌ Installation failed: {e}")
+    print(f"✅ Successfully updated: {skill_name}")
+    print(f"   Location: {installed_path}")
 
-            # Restore from backup
-            if backup_path and backup_path.exists():
-                print(f"🔄 Restoring from backup...")
-                try:
-                    shutil.copytree(backup_path, skill_dir)
-                    print("✅ Successfully restored from backup")
-                except Exception as restore_error:
-                    print(f"❌ Could not restore backup: {restore_error}")
+    # Remove backup on success; the new version stays installed even if this fails
+    if backup_path and backup_path.exists():
+        try:
+            shutil.rmtree(backup_path)
+            print("🗑️  Backup removed (update successful)")
+        except OSError as e:
+            print(f"⚠️  Warning: Could not remove backup {backup_path}: {e}")
 
-            return False
+    return True
 
 
 def main():
+    ensure_utf8_output()
+
     parser = argparse.ArgumentParser(description="Download and install skill updates from SkillsMP")
     parser.add_argument("skill_name", help="Name of the skill to update")
 
@@ -261,29 +318,35 @@ def main():
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Show what would be done without actually installing",
+        help="Show what would be done without installing or contacting GitHub",
     )
 
     args = parser.parse_args()
 
     try:
         if args.dry_run:
-            print("🔍 Dry run mode - showing planned actions:\n")
-            print(f"Skill to update: {args.skill_name}")
+            lines = [
+                "🔍 Dry run mode - showing planned actions:\n",
+                f"Skill to update: {args.skill_name}",
+            ]
 
             if args.download_url:
-                print(f"Download URL: {args.download_url}")
+                lines.append(f"Download URL: {args.download_url}")
             elif args.github_url:
-                inferred = infer_download_url(args.github_url, args.skill_name)
-                print(f"GitHub URL: {args.github_url}")
-                print(f"Inferred download URL: {inferred}")
+                # List the candidates instead of probing them, so dry runs work offline
+                candidates = candidate_download_urls(args.github_url, args.skill_name)
+                lines.append(f"GitHub URL: {args.github_url}")
+                lines.append(
+                    "Candidate download URLs (not checked; the first that exists is used):"
+                )
+                lines.extend(f"  {url}" for url in candidates or ["(none: not a GitHub URL)"])
             else:
                 print("❌ No download source specified")
                 sys.exit(1)
 
-            backup_msg = "Backup: " + ("No (disabled)" if args.no_backup else "Yes")
-            print(backup_msg)
-            print("\n✅ Dry run complete - no changes made")
+            lines.append(f"Backup: {'No (disabled)' if args.no_backup else 'Yes'}")
+            lines.append("\n✅ Dry run complete - no changes made")
+            print("\n".join(lines))
             return
 
         # Perform actual installation
@@ -5,11 +5,17 @@ View detailed information about a specific skill.
 """
 
 import argparse
-import json
 import sys
 from typing import Optional
 
-from utils import APIRequestError, SkillsMPError, load_api_key, make_api_request
+from utils import (
+    APIRequestError,
+    SkillsMPError,
+    ensure_utf8_output,
+    load_api_key,
+    make_api_request,
+    print_json,
+)
 
 
 def get_skill_details(skill_id: str, api_key: Optional[str] = None) -> dict:
@@ -33,49 +39,49 @@ def get_skill_details(skill_id: str, api_key: Optional[str] = None) -> dict:
 
 def format_skill_details(skill: dict):
     """Format skill details for display"""
-    print("\n" + "=" * 60)
-    print(f"📦 {skill.get('name', 'Unknown')}")
-    print("=" * 60)
-
-    # Basic info
-    print(f"\n👤 Author: {skill.get('author', 'Unknown')}")
-    print(f"⭐ Stars: {skill.get('stars', 0)}")
-    print(f"📅 Version: {skill.get('version', 'N/A')}")
-
-    # Description
-    description = skill.get("description", "No description")
-    print(f"\n📝 Description:")
-    print(f"   {description}")
+    lines = [
+        "\n" + "=" * 60,
+        f"📦 {skill.get('name', 'Unknown')}",
+        "=" * 60,
+        # Basic info
+        f"\n👤 Author: {skill.get('author', 'Unknown')}",
+        f"⭐ Stars: {skill.get('stars', 0)}",
+        f"📅 Version: {skill.get('version', 'N/A')}",
+        # Description
+        "\n📝 Description:",
+        f"   {skill.get('description', 'No description')}",
+    ]
 
     # Categories/Tags
     tags = skill.get("tags", [])
     if tags:
-        print(f"\n🏷️  Tags: {', '.join(tags)}")
+        lines.append(f"\n🏷️  Tags: {', '.join(tags)}")
 
     # Installation command
     repo_url = skill.get("repository_url", "")
     if repo_url:
-        print(f"\n🔗 Repository: {repo_url}")
-        print(f"📦 Install: npx skills add {repo_url.split('github.com/')[-1]}")
+        lines.append(f"\n🔗 Repository: {repo_url}")
+        lines.append(f"📦 Install: npx skills add {repo_url.split('github.com/')[-1]}")
 
     # Requirements
     requirements = skill.get("requirements", [])
     if requirements:
-        print(f"\n📋 Requirements:")
-        for req in requirements:
-            print(f"   - {req}")
+        lines.append("\n📋 Requirements:")
+        lines.extend(f"   - {req}" for req in requirements)
 
     # Examples
     examples = skill.get("examples", [])
     if examples:
-        print(f"\n💡 Usage Examples:")
-        for i, example in enumerate(examples, 1):
-            print(f"   {i}. {example}")
+        lines.append("\n💡 Usage Examples:")
+        lines.extend(f"   {i}. {example}" for i, example in enumerate(examples, 1))
 
-    print("\n" + "=" * 60 + "\n")
+    lines.append("\n" + "=" * 60 + "\n")
+    print("\n".join(lines))
 
 
 def main():
+    ensure_utf8_output()
+
     parser = argparse.ArgumentParser(description="View detailed information about a SkillsMP skill")
     parser.add_argument("skill_id", help="Skill ID or name")
     parser.add_argument("--json", action="store_true", help="Output raw JSON")
@@ -87,7 +93,7 @@ def main():
         details = get_skill_details(args.skill_id, api_key=args.api_key)
 
         if args.json:
-            print(json.dumps(details, indent=2))
+            print_json(details)
         else:
             format_skill_details(details)
 
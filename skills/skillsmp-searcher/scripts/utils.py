@@ -3,14 +3,32 @@
 Shared utilities for SkillsMP search scripts
 """
 
+import codecs
+import contextlib
+import copy
+import functools
+import hashlib
+import io
+import json
 import os
-import subprocess
+import shutil
 import sys
+import tempfile
+import threading
+import time
 import zipfile
 from pathlib import Path
-from typing import Dict, Optional
+from typing import IO, Any, ContextManager, Dict, Iterator, Optional, Tuple, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as URLLib3HTTPError
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
 
 
 class SkillsMPError(Exception):
@@ -37,14 +55,193 @@ API_KEY_FILE = os.path.join(os.path.dirname(os.path.dirname(__file__)), "referen
 API_KEY_REAL_FILE = os.path.join(
     os.path.dirname(os.path.dirname(__file__)), "references", "api_key_real.txt"
 )
+# Further key files tried after the two above; the repository-root scripts add theirs here
+FALLBACK_API_KEY_FILES: Tuple[str, ...] = ()
+
+# Bytes read per iteration when streaming a download to disk
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Downloaded archives up to this size stay in memory instead of a temporary file
+ARCHIVE_SPOOL_SIZE = 32 << 20
+
+# Bytes of an HTTP error body quoted in the raised error message
+ERROR_BODY_EXCERPT_SIZE = 200
+
+# Response cache configuration
+CACHE_FILE = (
+    Path(os.getenv("SKILLSMP_CACHE_DIR", str(Path.home() / ".cache" / "skillsmp")))
+    / "responses.json"
+)
+# Seconds a cached response stays fresh, per endpoint (endpoints not listed are never cached)
+CACHE_TTL = {
+    "/skills/search": 600,
+    "/skills/ai-search": 300,
+}
+# Seconds an expired entry is kept so it can be revalidated with a conditional request
+CACHE_REVALIDATE_WINDOW = 86400
+_CACHE_LOCK = threading.Lock()
+# Last cache read or written, as (file signature, parsed contents)
+_CACHE_MEMO: Optional[Tuple[Tuple[str, int, int], Dict[str, Any]]] = None
+# In-memory cache shared by requests inside batched_cache_writes(), None outside it
+_CACHE_BATCH: Optional[Dict[str, Any]] = None
+_CACHE_BATCH_DIRTY = False
+
+# Seconds to wait for a connection to SkillsMP; reads use the per-request timeout
+CONNECT_TIMEOUT = 3.05
+
+# Maximum sustained rate of requests sent to the SkillsMP API
+RATE_LIMIT_PER_SECOND = 5
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket that spaces out outgoing requests.
+
+    Up to `capacity` requests go through immediately; after that, callers are
+    held back so that no more than `rate` requests are sent per second.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller is allowed to send a request."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Reserve a token even if it is not available yet, then wait for it
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+        if wait > 0:
+            time.sleep(wait)
+
+
+_RATE_LIMITER = RateLimiter(rate=RATE_LIMIT_PER_SECOND, capacity=RATE_LIMIT_PER_SECOND)
+
+
+def json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize an object as indented JSON for display, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, indent=2, ensure_ascii=False)
+
+
+def print_json(obj: Any) -> None:
+    """
+    Print an object to stdout as indented JSON.
+
+    With orjson the encoded bytes go straight to the stdout buffer, skipping
+    the bytes -> str -> bytes round trip of print().
+
+    Args:
+        obj: JSON-serializable object
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        print(json_dumps(obj))
+        return
+    # Text already printed must reach the buffer first to keep the output in order
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    buffer.flush()
+
+
+def ensure_utf8_output() -> None:
+    """
+    Switch stdout and stderr to UTF-8 on Windows.
+
+    Windows consoles default to a legacy code page that cannot encode the emoji
+    output. Streams are reconfigured in place, and only when they are not UTF-8 already.
+    """
+    if sys.platform != "win32":
+        return
+    for stream in (sys.stdout, sys.stderr):
+        if isinstance(stream, io.TextIOWrapper) and codecs.lookup(stream.encoding).name != "utf-8":
+            stream.reconfigure(encoding="utf-8")
+
+
+def truncate_text(text: str, limit: int = 100) -> str:
+    """Shorten text to at most `limit` characters, marking cut text with '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the HTTP session shared by all API requests.
+
+    Reusing one session keeps connections to SkillsMP alive between calls, so
+    only the first request in a process pays for the TCP/TLS handshake.
+    Transient server errors are retried through the same connection pool.
+
+    Returns:
+        requests.Session: Configured session
+    """
+    session = requests.Session()
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET"],
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _create_session()
+
+
+def _read_key_file(file_path: str) -> Optional[str]:
+    """
+    Read the first usable line of an API key file.
+
+    Empty lines, comments and the template placeholder are skipped.
+
+    Args:
+        file_path: Path to the key file
+
+    Returns:
+        The key, or None if the file is missing or holds no key
+    """
+    try:
+        # Unbuffered read sizes itself from the file's stat, so a key file is one read
+        with open(file_path, "rb", buffering=0) as f:
+            data = f.read()
+    except FileNotFoundError:
+        return None
+
+    for line in data.decode("utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#") and "your_api_key_here" not in line.lower():
+            return line
+    return None
 
 
+@functools.lru_cache(maxsize=1)
 def load_api_key() -> str:
     """
     Load API key from multiple sources (priority order):
     1. Environment variable SKILLSMP_API_KEY
     2. File references/api_key_real.txt (for development, gitignored)
     3. File references/api_key.txt (template file)
+    4. Any FALLBACK_API_KEY_FILES, in order
+
+    The key is resolved once per process; use load_api_key.cache_clear() to reload it.
 
     Returns:
         str: API key
@@ -57,30 +254,12 @@ def load_api_key() -> str:
     if env_key:
         return env_key
 
-    # Helper function to read first non-comment line from file
-    def read_first_valid_key(file_path: Path) -> Optional[str]:
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if line and not line.startswith("#"):
-                        # Skip placeholder text
-                        if "your_api_key_here" not in line.lower():
-                            return line
-        except FileNotFoundError:
-            pass
-        return None
-
-    # Try api_key_real.txt (for development)
-    key = read_first_valid_key(Path(API_KEY_REAL_FILE))
-    if key:
-        return key
-
-    # Try api_key.txt (template file)
-    key = read_first_valid_key(Path(API_KEY_FILE))
-    if key:
-        return key
+    # api_key_real.txt (for development) takes precedence over the api_key.txt template
+    key_files = (API_KEY_REAL_FILE, API_KEY_FILE, *FALLBACK_API_KEY_FILES)
+    for key_file in key_files:
+        key = _read_key_file(key_file)
+        if key:
+            return key
 
     # No valid API key found
     raise APIKeyError(
@@ -89,7 +268,9 @@ def load_api_key() -> str:
         "1. Set environment variable SKILLSMP_API_KEY (recommended)\n"
         "2. Create file: references/api_key_real.txt\n"
         "3. Edit file: references/api_key.txt\n\n"
-        "See README.md for detailed instructions."
+        "Key files checked:\n"
+        + "".join(f"  {os.path.normpath(key_file)}\n" for key_file in key_files)
+        + "\nSee README.md for detailed instructions."
     )
 
 
@@ -113,20 +294,184 @@ def load_proxies() -> Optional[Dict[str, str]]:
     return None
 
 
+def _cache_signature() -> Optional[Tuple[str, int, int]]:
+    """Identify the current cache file contents by path, mtime and size."""
+    try:
+        st = CACHE_FILE.stat()
+    except OSError:
+        return None
+    return str(CACHE_FILE), st.st_mtime_ns, st.st_size
+
+
+def read_cache() -> Dict[str, Any]:
+    """
+    Load cached API responses from disk.
+
+    The parsed cache is kept in memory and reused until the file changes on disk.
+
+    Returns:
+        Dict mapping cache keys to entries, or an empty dict if no usable cache
+        exists. The dict may be shared with later calls and must not be modified.
+    """
+    global _CACHE_MEMO
+    signature = _cache_signature()
+    if signature is None:
+        return {}
+    memo = _CACHE_MEMO
+    if memo is not None and memo[0] == signature:
+        return memo[1]
+
+    try:
+        data = json_loads(CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        data = {}
+    _CACHE_MEMO = (signature, data)
+    return data
+
+
+def write_cache(data: Dict[str, Any]) -> None:
+    """
+    Persist cached API responses to disk as compact JSON.
+
+    The file is replaced atomically. The cache is best-effort: failures to
+    write it are silently ignored.
+
+    Args:
+        data: Dict mapping cache keys to entries
+    """
+    global _CACHE_MEMO
+    if orjson is not None:
+        payload = orjson.dumps(data)
+    else:
+        payload = json.dumps(data, separators=(",", ":")).encode("utf-8")
+    # Write a temporary file and rename it over the cache, so an interrupted
+    # write never leaves a truncated cache behind
+    tmp_file = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, CACHE_FILE)
+    except OSError:
+        try:
+            tmp_file.unlink()
+        except OSError:
+            pass
+        return
+    signature = _cache_signature()
+    if signature is not None:
+        _CACHE_MEMO = (signature, data)
+
+
+def _cache_key(endpoint: str, params: Dict, api_key: str) -> str:
+    """
+    Build a stable cache key from an endpoint, its query parameters and the API key.
+
+    The key is part of the hashed input, so responses fetched with one API key
+    are never served to another, and the cache file never contains the key itself.
+    """
+    raw = json.dumps([endpoint, sorted(params.items()), api_key], default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _prune_cache(cache: Dict[str, Any], now: float) -> Dict[str, Any]:
+    """Drop entries that expired too long ago to be revalidated."""
+    cutoff = now - CACHE_REVALIDATE_WINDOW
+    return {k: v for k, v in cache.items() if v.get("expires", 0) > cutoff}
+
+
+def _load_cache() -> Dict[str, Any]:
+    """Return the active batch cache, or read the cache from disk."""
+    batch = _CACHE_BATCH
+    return batch if batch is not None else read_cache()
+
+
+@contextlib.contextmanager
+def batched_cache_writes() -> Iterator[None]:
+    """
+    Load the response cache once and write it back once for a run of requests.
+
+    Without a batch every cached request reads and rewrites the whole cache
+    file. Nested batches share the outermost one.
+    """
+    global _CACHE_BATCH, _CACHE_BATCH_DIRTY
+    with _CACHE_LOCK:
+        outermost = _CACHE_BATCH is None
+        if outermost:
+            batch: Dict[str, Any] = dict(read_cache())
+            _CACHE_BATCH = batch
+            _CACHE_BATCH_DIRTY = False
+    if not outermost:
+        yield
+        return
+
+    try:
+        yield
+    finally:
+        with _CACHE_LOCK:
+            _CACHE_BATCH = None
+            if _CACHE_BATCH_DIRTY:
+                write_cache(_prune_cache(batch, time.time()))
+
+
+def _store_cached_response(
+    key: str, data: Dict, ttl: int, response_headers: Any, previous: Optional[Dict] = None
+) -> None:
+    """
+    Add a response to the on-disk cache, dropping entries too old to revalidate.
+
+    The response's ETag and Last-Modified validators are stored with it so an
+    expired entry can later be refreshed with a conditional request. A 304 often
+    omits them, so any the response leaves out are kept from the previous entry.
+    Inside batched_cache_writes() the entry is only added to the in-memory batch.
+    """
+    global _CACHE_BATCH_DIRTY
+    now = time.time()
+    previous = previous or {}
+    entry: Dict[str, Any] = {"expires": now + ttl, "data": data}
+    etag = response_headers.get("ETag") or previous.get("etag")
+    if etag:
+        entry["etag"] = etag
+    last_modified = response_headers.get("Last-Modified") or previous.get("last_modified")
+    if last_modified:
+        entry["last_modified"] = last_modified
+
+    with _CACHE_LOCK:
+        if _CACHE_BATCH is not None:
+            _CACHE_BATCH[key] = entry
+            _CACHE_BATCH_DIRTY = True
+            return
+        cache = _prune_cache(read_cache(), now)
+        cache[key] = entry
+        write_cache(cache)
+
+
 def make_api_request(
     endpoint: str,
     params: Dict,
     api_key: Optional[str] = None,
     timeout: int = 10,
+    use_cache: bool = True,
+    cache_ttl: Optional[int] = None,
 ) -> Dict:
     """
     Make an API request to SkillsMP with error handling and proxy support.
 
+    Successful responses from the endpoints in CACHE_TTL are cached on disk, so
+    repeating the same request within the TTL does not hit the network. Once an
+    entry has expired (or the cache is bypassed), the request is sent with
+    If-None-Match/If-Modified-Since and a 304 reply reuses the cached body.
+
     Args:
         endpoint: API endpoint (e.g., '/skills/search')
         params: Query parameters
         api_key: SkillsMP API key (if None, will load from config)
-        timeout: Request timeout in seconds (default: 10)
+        timeout: Read timeout in seconds (default: 10). Connecting is limited
+            to CONNECT_TIMEOUT so an unreachable server fails fast.
+        use_cache: Return a fresh cached response if available (default: True).
+            The response is cached either way.
+        cache_ttl: Cache lifetime in seconds (default: per-endpoint value from CACHE_TTL)
 
     Returns:
         dict: API response data
@@ -138,36 +483,76 @@ def make_api_request(
     if api_key is None:
         api_key = load_api_key()
 
+    ttl = CACHE_TTL.get(endpoint, 0) if cache_ttl is None else cache_ttl
+    key = _cache_key(endpoint, params, api_key) if ttl > 0 else None
+    entry = _load_cache().get(key) if key else None
+    # Cached dicts are shared by every caller in the process; hand out copies
+    if entry and use_cache and entry.get("expires", 0) > time.time():
+        return copy.deepcopy(entry["data"])
+
     url = f"{BASE_URL}{endpoint}"
     headers = {
         "Authorization": f"Bearer {api_key}",
         "Content-Type": "application/json",
     }
+    if entry and "etag" in entry:
+        headers["If-None-Match"] = entry["etag"]
+    if entry and "last_modified" in entry:
+        headers["If-Modified-Since"] = entry["last_modified"]
     proxies = load_proxies()
 
+    _RATE_LIMITER.acquire()
     try:
-        response = requests.get(
-            url, headers=headers, params=params, proxies=proxies, timeout=timeout
+        response = _SESSION.get(
+            url,
+            headers=headers,
+            params=params,
+            proxies=proxies,
+            timeout=(min(CONNECT_TIMEOUT, timeout), timeout),
         )
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.HTTPError as e:
-        if response.status_code == 401:
-            error_data = response.json()
-            raise APIRequestError(
-                f"API authentication failed: {error_data.get('error', {}).get('message', 'Invalid API key')}"
-            ) from e
-        raise APIRequestError(f"HTTP error {response.status_code}: {e}") from e
     except requests.exceptions.Timeout:
         raise APIRequestError(f"Request timed out after {timeout} seconds") from None
     except requests.exceptions.RequestException as e:
         raise APIRequestError(f"Request failed: {e}") from e
 
+    # Decode the body once; error responses reuse it for their message
+    decode_error: Optional[ValueError] = None
+    if response.status_code == 304 and entry:
+        # Unchanged on the server: keep the cached body
+        data = copy.deepcopy(entry["data"])
+    else:
+        try:
+            data = json_loads(response.content)
+        except ValueError as e:
+            data, decode_error = {}, e
+
+    try:
+        response.raise_for_status()
+    except requests.exceptions.HTTPError as e:
+        if response.status_code == 401:
+            message = data.get("error", {}).get("message", "Invalid API key")
+            raise APIRequestError(f"API authentication failed: {message}") from e
+        # Quote at most the start of the body; error pages can be large HTML documents
+        excerpt = response.content[:ERROR_BODY_EXCERPT_SIZE].decode("utf-8", errors="replace")
+        detail = f" - {excerpt.strip()}" if excerpt.strip() else ""
+        raise APIRequestError(f"HTTP error {response.status_code}: {e}{detail}") from e
+
+    if decode_error is not None:
+        raise APIRequestError(f"Invalid JSON in API response: {decode_error}") from decode_error
 
+    if key and data.get("success", True):
+        previous = entry if response.status_code == 304 else None
+        _store_cached_response(key, copy.deepcopy(data), ttl, response.headers, previous)
+    return data
+
+
+@functools.lru_cache(maxsize=1)
 def get_claude_skills_dir() -> Path:
     """
     Get the Claude Code skills directory.
 
+    The result is cached for the lifetime of the process.
+
     Returns:
         Path: Path to Claude skills directory
 
@@ -194,6 +579,149 @@ def get_claude_skills_dir() -> Path:
         raise SkillsMPError(f"Cannot create Claude skills directory: {e}") from e
 
 
+@contextlib.contextmanager
+def _response_body(response: requests.Response) -> Iterator[Any]:
+    """
+    Expose the raw body stream of a streamed response for reading.
+
+    Reading the raw stream directly avoids iter_content, which allocates and
+    yields every chunk through a generator.
+
+    Args:
+        response: Streamed response whose body has not been read yet
+
+    Yields:
+        The decoded raw body stream
+
+    Raises:
+        requests.exceptions.ChunkedEncodingError: If the connection breaks mid-body
+    """
+    # Undo any Content-Encoding (gzip/deflate) the way iter_content would
+    response.raw.decode_content = True
+    try:
+        yield response.raw
+    except URLLib3HTTPError as e:
+        # Callers handle requests' exceptions, so translate urllib3's as iter_content does
+        raise requests.exceptions.ChunkedEncodingError(e) from e
+
+
+def _copy_response_body(response: requests.Response, dest: IO[bytes]) -> None:
+    """
+    Copy a streamed response body into a binary file object.
+
+    Args:
+        response: Streamed response whose body has not been read yet
+        dest: Binary file object to write to
+
+    Raises:
+        requests.exceptions.ChunkedEncodingError: If the connection breaks mid-body
+    """
+    with _response_body(response) as body:
+        shutil.copyfileobj(body, dest, DOWNLOAD_CHUNK_SIZE)
+
+
+def download_file(url: str, dest_path: Path, timeout: int = 30) -> Path:
+    """
+    Stream a file to disk through the shared HTTP session.
+
+    Data is written to a ".part" file next to dest_path and moved into place only
+    once the download completes, so a failed download never leaves a truncated file.
+
+    Args:
+        url: URL to download
+        dest_path: Destination file path (parent directories are created)
+        timeout: Read timeout in seconds (default: 30)
+
+    Returns:
+        Path: dest_path
+
+    Raises:
+        requests.exceptions.RequestException: If the download fails or the
+            server returns an error status
+    """
+    response = _SESSION.get(
+        url, proxies=load_proxies(), timeout=(CONNECT_TIMEOUT, timeout), stream=True
+    )
+    # Closing the response hands its connection back to the pool, even on error
+    with response:
+        response.raise_for_status()
+        dest_path.parent.mkdir(parents=True, exist_ok=True)
+        part_path = dest_path.with_name(dest_path.name + ".part")
+        try:
+            with open(part_path, "wb") as f:
+                _copy_response_body(response, f)
+            os.replace(part_path, dest_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                part_path.unlink()
+            raise
+    return dest_path
+
+
+def download_to_buffer(url: str, timeout: int = 30) -> IO[bytes]:
+    """
+    Download a file into memory through the shared HTTP session.
+
+    Data beyond ARCHIVE_SPOOL_SIZE spills over to a temporary file, so very
+    large downloads do not have to fit in memory.
+
+    Args:
+        url: URL to download
+        timeout: Read timeout in seconds (default: 30)
+
+    Returns:
+        Binary file object positioned at the start of the data; the caller closes it
+
+    Raises:
+        requests.exceptions.RequestException: If the download fails or the
+            server returns an error status
+    """
+    # Not a SpooledTemporaryFile: before Python 3.11 it lacks seekable(), which ZipFile needs
+    memory = io.BytesIO()
+    buffer: IO[bytes] = memory
+    try:
+        response = _SESSION.get(
+            url, proxies=load_proxies(), timeout=(CONNECT_TIMEOUT, timeout), stream=True
+        )
+        with response, _response_body(response) as body:
+            response.raise_for_status()
+            for chunk in iter(functools.partial(body.read, DOWNLOAD_CHUNK_SIZE), b""):
+                if buffer is memory and memory.tell() + len(chunk) > ARCHIVE_SPOOL_SIZE:
+                    buffer = tempfile.TemporaryFile()
+                    buffer.write(memory.getvalue())
+                    memory.close()
+                buffer.write(chunk)
+    except BaseException:
+        buffer.close()
+        raise
+    buffer.seek(0)
+    return buffer
+
+
+def url_exists(url: str, timeout: int = 5) -> bool:
+    """
+    Check whether a URL can be downloaded, using a HEAD request on the shared session.
+
+    Args:
+        url: URL to check
+        timeout: Read timeout in seconds (default: 5)
+
+    Returns:
+        True if the URL answers 200 after following redirects, False otherwise
+        (including network errors)
+    """
+    try:
+        response = _SESSION.head(
+            url,
+            proxies=load_proxies(),
+            timeout=(CONNECT_TIMEOUT, timeout),
+            allow_redirects=True,
+        )
+    except requests.exceptions.RequestException:
+        return False
+    return response.status_code == 200
+
+
 def download_skill(skill_url: str, download_dir: Path) -> Path:
     """
     Download a skill file from URL.
@@ -208,24 +736,46 @@ def download_skill(skill_url: str, download_dir: Path) -> Path:
     Raises:
         APIRequestError: If download fails
     """
-    proxies = load_proxies()
+    # Extract filename from URL or use default
+    filename = skill_url.split("/")[-1] or "downloaded_skill.skill"
 
     try:
-        response = requests.get(skill_url, proxies=proxies, timeout=30, stream=True)
-        response.raise_for_status()
+        return download_file(skill_url, download_dir / filename)
+    except requests.exceptions.RequestException as e:
+        raise APIRequestError(f"Failed to download skill: {e}") from e
 
-        # Extract filename from URL or use default
-        filename = skill_url.split("/")[-1] or "downloaded_skill.skill"
-        skill_path = download_dir / filename
 
-        with open(skill_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+def _extract_zip(zip_ref: zipfile.ZipFile, dest_dir: Path) -> None:
+    """
+    Extract every member of an archive into dest_dir.
 
-        return skill_path
-    except requests.exceptions.RequestException as e:
-        raise APIRequestError(f"Failed to download skill: {e}") from e
+    Each directory is created once up front and files are copied with a
+    buffer sized to the member (up to DOWNLOAD_CHUNK_SIZE) instead of
+    extractall's small fixed buffer.
+
+    Raises:
+        SkillsMPError: If a member would be written outside dest_dir
+    """
+    root = os.path.abspath(dest_dir)
+    members = []
+    for info in zip_ref.infolist():
+        target = os.path.normpath(os.path.join(root, info.filename))
+        if os.path.commonpath([root, target]) != root:
+            raise SkillsMPError(f"Unsafe path in skill file: {info.filename}")
+        members.append((info, target))
+
+    for directory in sorted(
+        {target if info.is_dir() else os.path.dirname(target) for info, target in members}
+    ):
+        os.makedirs(directory, exist_ok=True)
+
+    for info, target in members:
+        if info.is_dir():
+            continue
+        with open(target, "wb") as dst:
+            if info.file_size:
+                with zip_ref.open(info) as src:
+                    shutil.copyfileobj(src, dst, min(info.file_size, DOWNLOAD_CHUNK_SIZE))
 
 
 def install_skill(skill_path: Path, skills_dir: Optional[Path] = None) -> Path:
@@ -242,22 +792,55 @@ def install_skill(skill_path: Path, skills_dir: Optional[Path] = None) -> Path:
     Raises:
         SkillsMPError: If installation fails
     """
-    if skills_dir is None:
-        skills_dir = get_claude_skills_dir()
-
     if not skill_path.exists():
         raise SkillsMPError(f"Skill file not found: {skill_path}")
 
+    return _install_zip(skill_path, skills_dir, source=str(skill_path))
+
+
+def install_skill_archive(
+    archive: Union[IO[bytes], zipfile.ZipFile], skills_dir: Optional[Path] = None
+) -> Path:
+    """
+    Install a skill from an open .skill archive, such as a downloaded buffer.
+
+    Args:
+        archive: Seekable binary file object containing the .skill zip, or a
+            ZipFile the caller already opened (its central directory is reused
+            instead of being parsed again; the caller keeps ownership)
+        skills_dir: Custom skills directory (if None, uses default Claude location)
+
+    Returns:
+        Path: Path to installed skill directory
+
+    Raises:
+        SkillsMPError: If installation fails
+    """
+    return _install_zip(archive, skills_dir, source="downloaded archive")
+
+
+def _install_zip(
+    archive: Union[Path, IO[bytes], zipfile.ZipFile], skills_dir: Optional[Path], source: str
+) -> Path:
+    """Extract a .skill zip into the skills directory and return the skill's directory."""
+    if skills_dir is None:
+        skills_dir = get_claude_skills_dir()
+
     # Extract the skill file
     try:
-        with zipfile.ZipFile(skill_path, "r") as zip_ref:
+        opened: ContextManager[zipfile.ZipFile] = (
+            contextlib.nullcontext(archive)
+            if isinstance(archive, zipfile.ZipFile)
+            else zipfile.ZipFile(archive, "r")
+        )
+        with opened as zip_ref:
             # Get the root directory name in the zip
             namelist = zip_ref.namelist()
             if not namelist:
                 raise SkillsMPError("Skill file is empty")
 
             # Extract all contents
-            zip_ref.extractall(skills_dir)
+            _extract_zip(zip_ref, skills_dir)
 
             # Find the extracted skill directory
             # Typically the first entry is the skill directory
@@ -269,7 +852,9 @@ def install_skill(skill_path: Path, skills_dir: Optional[Path] = None) -> Path:
             return installed_path
 
     except zipfile.BadZipFile:
-        raise SkillsMPError(f"Invalid skill file: {skill_path}") from None
+        raise SkillsMPError(f"Invalid skill file: {source}") from None
+    except SkillsMPError:
+        raise
     except Exception as e:
         raise SkillsMPError(f"Failed to install skill: {e}") from e
 
@@ -289,13 +874,14 @@ def install_skill_from_url(skill_url: str, skills_dir: Optional[Path] = None) ->
         APIRequestError: If download fails
         SkillsMPError: If installation fails
     """
-    # Download to temp directory
-    import tempfile
+    # Download into memory; no temporary .skill file is written and read back
+    try:
+        archive = download_to_buffer(skill_url)
+    except requests.exceptions.RequestException as e:
+        raise APIRequestError(f"Failed to download skill: {e}") from e
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-        skill_file = download_skill(skill_url, temp_path)
-        return install_skill(skill_file, skills_dir)
+    with archive:
+        return install_skill_archive(archive, skills_dir)
 
 
 def list_installed_skills(skills_dir: Optional[Path] = None) -> list[str]:
@@ -311,12 +897,14 @@ def list_installed_skills(skills_dir: Optional[Path] = None) -> list[str]:
     if skills_dir is None:
         skills_dir = get_claude_skills_dir()
 
-    if not skills_dir.exists():
+    try:
+        with os.scandir(skills_dir) as it:
+            skills = [
+                entry.name
+                for entry in it
+                if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+            ]
+    except FileNotFoundError:
         return []
 
-    skills = []
-    for item in skills_dir.iterdir():
-        if item.is_dir() and (item / "SKILL.md").exists():
-            skills.append(item.name)
-
     return sorted(skills)
@@ -2,15 +2,60 @@
 Pytest configuration and shared fixtures for SkillsMP Searcher tests
 """
 
+import json
 import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
 
+# Make the skill's scripts importable as top-level modules; resolved once so the
+# import system sees a canonical directory rather than a path with ".." segments
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "skills" / "skillsmp-searcher" / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def clean_environment(monkeypatch):
+    """Start every test without an API key or proxy inherited from the shell"""
+    for name in ("SKILLSMP_API_KEY", "HTTP_PROXY", "HTTPS_PROXY", "http_proxy", "https_proxy"):
+        monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(tmp_path, monkeypatch):
+    """Keep the on-disk response cache out of the user's home directory"""
+    import utils
+
+    monkeypatch.setattr(utils, "CACHE_FILE", tmp_path / "cache" / "responses.json")
+
+
+@pytest.fixture(autouse=True)
+def fresh_rate_limiter(monkeypatch):
+    """Give each test a full token bucket so earlier tests cannot slow it down"""
+    import utils
+
+    rate = utils.RATE_LIMIT_PER_SECOND
+    monkeypatch.setattr(utils, "_RATE_LIMITER", utils.RateLimiter(rate, capacity=rate))
+
+
+@pytest.fixture(autouse=True)
+def reset_process_caches():
+    """Make every test resolve the API key and skills directory from its own environment"""
+    import utils
+
+    utils.load_api_key.cache_clear()
+    utils.get_claude_skills_dir.cache_clear()
+    yield
+    utils.load_api_key.cache_clear()
+    utils.get_claude_skills_dir.cache_clear()
+
+
+@pytest.fixture(scope="session")
 def mock_api_response():
-    """Mock successful API response fixture"""
+    """Mock successful API response fixture (shared by all tests, so never mutate it)"""
     return {
         "success": True,
         "data": {
@@ -39,6 +84,33 @@ def mock_api_response():
     }
 
 
+@pytest.fixture
+def mock_response(mock_api_response):
+    """Mock successful HTTP response carrying mock_api_response as its body"""
+    # A plain namespace is all make_api_request needs and far cheaper to build than a Mock
+    return SimpleNamespace(
+        status_code=200,
+        content=json.dumps(mock_api_response).encode(),
+        headers={},
+        raise_for_status=lambda: None,
+    )
+
+
+@pytest.fixture
+def make_skill(tmp_path):
+    """Factory creating installed skills (a directory with SKILL.md) under tmp_path/skills"""
+
+    def _make(name="test-skill", content=None):
+        skill_dir = tmp_path / "skills" / name
+        skill_dir.mkdir(parents=True)
+        if content is None:
+            content = f"---\nname: {name}\n---\n"
+        (skill_dir / "SKILL.md").write_text(content)
+        return skill_dir
+
+    return _make
+
+
 @pytest.fixture
 def mock_api_error_response():
     """Mock API error response fixture"""
@@ -59,8 +131,22 @@ def mock_env_api_key():
 
 
 @pytest.fixture
-def temp_api_key_file(tmp_path):
-    """Create a temporary API key file"""
-    api_key_file = tmp_path / "api_key_real.txt"
-    api_key_file.write_text("sk_test_key_456")
-    return api_key_file
+def patched_key_files(monkeypatch, tmp_path):
+    """Point both API key files at the given paths; missing ones default to absent files"""
+    import utils
+
+    def _set(real=None, template=None):
+        monkeypatch.setattr(utils, "API_KEY_REAL_FILE", str(real or tmp_path / "missing_real.txt"))
+        monkeypatch.setattr(utils, "API_KEY_FILE", str(template or tmp_path / "missing.txt"))
+
+    return _set
+
+
+@pytest.fixture(scope="session")
+def api_key_files(tmp_path_factory):
+    """Directory of API key files written once per session (read-only for tests)"""
+    key_dir = tmp_path_factory.mktemp("keys")
+    (key_dir / "api_key_real.txt").write_text("sk_test_key_456")
+    (key_dir / "api_key.txt").write_text("sk_live_real_key_789")
+    (key_dir / "placeholder.txt").write_text("sk_live_your_api_key_here")
+    return key_dir
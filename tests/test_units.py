@@ -2,27 +2,39 @@
 Unit tests for SkillsMP Searcher scripts
 """
 
-import os
+import codecs
+import importlib.util
+import io
+import json
 import sys
-from unittest.mock import Mock, patch
+import threading
+import zipfile
+from pathlib import Path
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 import requests
-
-# Add scripts directory to path
-sys.path.insert(
-    0,
-    os.path.join(
-        os.path.dirname(__file__), "..", "skills", "skillsmp-searcher", "scripts"
-    ),
-)
+import urllib3
 
 import ai_search
+import check_updates
 import search_skills
+import skill_diff
+import skill_downloader
+import skill_info
 import utils
 from utils import APIKeyError, APIRequestError, SkillsMPError
 
 
+def _http_response(status_code, content):
+    """Build a real requests.Response so raise_for_status behaves as it does live"""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.url = "https://skillsmp.com/api/v1/skills/search"
+    return response
+
+
 class TestAPIKeyLoading:
     """Test API key loading from various sources"""
 
@@ -32,231 +44,559 @@ class TestAPIKeyLoading:
         key = utils.load_api_key()
         assert key == "test_key_123"
 
-    def test_load_from_real_file(self, tmp_path, monkeypatch):
+    def test_api_key_is_cached(self, monkeypatch):
+        """Test that the API key is only resolved once per process"""
+        monkeypatch.setenv("SKILLSMP_API_KEY", "first_key")
+        assert utils.load_api_key() == "first_key"
+
+        monkeypatch.setenv("SKILLSMP_API_KEY", "second_key")
+        assert utils.load_api_key() == "first_key"
+
+        utils.load_api_key.cache_clear()
+        assert utils.load_api_key() == "second_key"
+
+    def test_load_from_real_file(self, api_key_files, patched_key_files):
         """Test loading API key from api_key_real.txt"""
-        api_key_file = tmp_path / "api_key_real.txt"
-        api_key_file.write_text("sk_test_key_456")
+        patched_key_files(real=api_key_files / "api_key_real.txt")
 
-        with patch.object(utils, "API_KEY_REAL_FILE", str(api_key_file)):
-            monkeypatch.delenv("SKILLSMP_API_KEY", raising=False)
-            key = utils.load_api_key()
-            assert key == "sk_test_key_456"
+        assert utils.load_api_key() == "sk_test_key_456"
 
-    def test_load_from_template_file(self, tmp_path, monkeypatch):
+    def test_load_from_template_file(self, api_key_files, patched_key_files):
         """Test loading API key from api_key.txt template"""
-        api_key_file = tmp_path / "api_key.txt"
-        api_key_file.write_text("sk_live_real_key_789")
+        patched_key_files(template=api_key_files / "api_key.txt")
 
-        with patch.object(utils, "API_KEY_FILE", str(api_key_file)):
-            with patch.object(
-                utils, "API_KEY_REAL_FILE", str(tmp_path / "nonexistent.txt")
-            ):
-                monkeypatch.delenv("SKILLSMP_API_KEY", raising=False)
-                key = utils.load_api_key()
-                assert key == "sk_live_real_key_789"
+        assert utils.load_api_key() == "sk_live_real_key_789"
 
-    def test_load_template_file_skips_placeholder(self, tmp_path, monkeypatch):
+    def test_real_file_takes_precedence(self, api_key_files, patched_key_files):
+        """Test that api_key_real.txt wins over the api_key.txt template"""
+        patched_key_files(
+            real=api_key_files / "api_key_real.txt",
+            template=api_key_files / "api_key.txt",
+        )
+
+        assert utils.load_api_key() == "sk_test_key_456"
+
+    def test_load_template_file_skips_placeholder(self, api_key_files, patched_key_files):
         """Test that placeholder text in template file is skipped"""
+        patched_key_files(template=api_key_files / "placeholder.txt")
+
+        with pytest.raises(APIKeyError):
+            utils.load_api_key()
+
+    def test_key_file_skips_comments_and_blank_lines(self, tmp_path):
+        """Test that the first real line of a key file is used"""
         api_key_file = tmp_path / "api_key.txt"
-        api_key_file.write_text("sk_live_your_api_key_here")
+        api_key_file.write_bytes(b"# SkillsMP API key\r\n\r\n  sk_live_abc  \r\nsk_live_def\r\n")
+
+        assert utils._read_key_file(str(api_key_file)) == "sk_live_abc"
+        assert utils._read_key_file(str(tmp_path / "missing.txt")) is None
 
-        with patch.object(utils, "API_KEY_FILE", str(api_key_file)):
-            with patch.object(
-                utils, "API_KEY_REAL_FILE", str(tmp_path / "nonexistent.txt")
-            ):
-                monkeypatch.delenv("SKILLSMP_API_KEY", raising=False)
-                with pytest.raises(APIKeyError):
-                    utils.load_api_key()
+    def test_root_scripts_fall_back_to_root_key_file(
+        self, api_key_files, patched_key_files, monkeypatch
+    ):
+        """Test that the repository-root entry points also read the root key files"""
+        patched_key_files()
+        monkeypatch.setattr(utils, "FALLBACK_API_KEY_FILES", ())
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        shim = Path(utils.__file__).resolve().parents[3] / "scripts" / "search_skills.py"
+        spec = importlib.util.spec_from_file_location("root_search_skills", shim)
+        spec.loader.exec_module(importlib.util.module_from_spec(spec))
+
+        root_key_file = Path(utils.FALLBACK_API_KEY_FILES[-1]).resolve()
+        assert root_key_file == shim.parents[1] / "references" / "api_key.txt"
+
+        monkeypatch.setattr(
+            utils, "FALLBACK_API_KEY_FILES", (str(api_key_files / "api_key.txt"),)
+        )
+        assert utils.load_api_key() == "sk_live_real_key_789"
 
-    def test_load_no_api_key_raises_exception(self, tmp_path, monkeypatch):
+    def test_load_no_api_key_raises_exception(self, patched_key_files):
         """Test APIKeyError is raised when no API key is found"""
-        empty_dir = tmp_path / "empty"
-        empty_dir.mkdir()
+        patched_key_files()
 
-        with patch.object(
-            utils, "API_KEY_REAL_FILE", str(empty_dir / "nonexistent.txt")
-        ):
-            with patch.object(
-                utils, "API_KEY_FILE", str(empty_dir / "nonexistent.txt")
-            ):
-                monkeypatch.delenv("SKILLSMP_API_KEY", raising=False)
-                with pytest.raises(APIKeyError, match="No valid API key found"):
-                    utils.load_api_key()
+        with pytest.raises(APIKeyError, match="No valid API key found"):
+            utils.load_api_key()
 
 
 class TestProxyLoading:
     """Test proxy configuration loading"""
 
-    def test_load_http_proxy(self, monkeypatch):
-        """Test loading HTTP proxy"""
-        monkeypatch.setenv("HTTP_PROXY", "http://proxy.example.com:8080")
-        proxies = utils.load_proxies()
-        assert proxies is not None
-        assert proxies["http"] == "http://proxy.example.com:8080"
-
-    def test_load_https_proxy(self, monkeypatch):
-        """Test loading HTTPS proxy"""
-        monkeypatch.setenv("HTTPS_PROXY", "https://proxy.example.com:8443")
-        proxies = utils.load_proxies()
-        assert proxies is not None
-        assert proxies["https"] == "https://proxy.example.com:8443"
-
-    def test_load_both_proxies(self, monkeypatch):
-        """Test loading both HTTP and HTTPS proxies"""
-        monkeypatch.setenv("HTTP_PROXY", "http://proxy.example.com:8080")
-        monkeypatch.setenv("HTTPS_PROXY", "https://proxy.example.com:8443")
-        proxies = utils.load_proxies()
-        assert proxies is not None
-        assert proxies["http"] == "http://proxy.example.com:8080"
-        assert proxies["https"] == "https://proxy.example.com:8443"
-
-    def test_no_proxy_returns_none(self, monkeypatch):
-        """Test that None is returned when no proxy is configured"""
-        monkeypatch.delenv("HTTP_PROXY", raising=False)
-        monkeypatch.delenv("HTTPS_PROXY", raising=False)
-        monkeypatch.delenv("http_proxy", raising=False)
-        monkeypatch.delenv("https_proxy", raising=False)
-        proxies = utils.load_proxies()
-        assert proxies is None
+    @pytest.mark.parametrize(
+        "env, expected",
+        [
+            (
+                {"HTTP_PROXY": "http://proxy.example.com:8080"},
+                {"http": "http://proxy.example.com:8080"},
+            ),
+            (
+                {"HTTPS_PROXY": "https://proxy.example.com:8443"},
+                {"https": "https://proxy.example.com:8443"},
+            ),
+            (
+                {
+                    "HTTP_PROXY": "http://proxy.example.com:8080",
+                    "HTTPS_PROXY": "https://proxy.example.com:8443",
+                },
+                {
+                    "http": "http://proxy.example.com:8080",
+                    "https": "https://proxy.example.com:8443",
+                },
+            ),
+            (
+                {"http_proxy": "http://lower.example.com:3128"},
+                {"http": "http://lower.example.com:3128"},
+            ),
+            ({}, None),
+        ],
+        ids=["http", "https", "both", "lowercase", "none"],
+    )
+    def test_load_proxies(self, monkeypatch, env, expected):
+        """Test loading proxies from the environment (None when none are configured)"""
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+
+        assert utils.load_proxies() == expected
+
+
+class TestHTTPSession:
+    """Test the shared HTTP session used for API requests"""
+
+    def test_session_is_reused_across_requests(self, mock_response):
+        """Test that consecutive requests go through the same session"""
+        with patch.object(utils._SESSION, "get", return_value=mock_response) as mock_get:
+            search_skills.search_skills("first", api_key="test_key")
+            ai_search.ai_search("second", api_key="test_key")
+
+        assert mock_get.call_count == 2
+
+    @patch("utils._SESSION.get")
+    def test_download_uses_session(self, mock_get, tmp_path):
+        """Test that skill downloads are streamed through the shared session"""
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw = io.BytesIO(b"zipdata")
+        mock_get.return_value = mock_response
+
+        path = utils.download_skill("https://example.com/my.skill", tmp_path)
+
+        assert path == tmp_path / "my.skill"
+        assert path.read_bytes() == b"zipdata"
+        assert mock_get.call_args[1]["stream"] is True
+        mock_response.__exit__.assert_called_once()
+
+    @patch("utils._SESSION.get")
+    def test_interrupted_download_leaves_no_file(self, mock_get, tmp_path):
+        """Test that a download failing mid-stream keeps the destination untouched"""
+        dest = tmp_path / "my.skill"
+        dest.write_bytes(b"previous")
+
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw.read.side_effect = [
+            b"partial",
+            urllib3.exceptions.ProtocolError("connection reset"),
+        ]
+        mock_get.return_value = mock_response
+
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            utils.download_file("https://example.com/my.skill", dest)
+
+        assert dest.read_bytes() == b"previous"
+        assert list(tmp_path.iterdir()) == [dest]
+
+    def test_session_retries_transient_errors(self):
+        """Test that the HTTPS adapter retries transient server errors"""
+        adapter = utils._SESSION.get_adapter("https://skillsmp.com")
+        assert adapter.max_retries.total == 3
+        assert 503 in adapter.max_retries.status_forcelist
 
 
 class TestSearchFunctions:
     """Test search functionality"""
 
-    @patch("utils.requests.get")
-    def test_search_skills_success(self, mock_get, mock_api_response):
-        """Test successful API call for keyword search"""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
-
-        result = search_skills.search_skills("test", api_key="test_key")
+    @pytest.fixture(autouse=True)
+    def _patch_session_get(self):
+        """Patch the shared session's get for every test in the class"""
+        with patch("utils._SESSION.get") as mock_get:
+            self.mock_get = mock_get
+            yield
+
+    @pytest.mark.parametrize(
+        "call, expected_timeout",
+        [
+            (lambda: search_skills.search_skills("test", api_key="test_key"), 10),
+            (lambda: ai_search.ai_search("How to create a scraper", api_key="test_key"), 10),
+            (
+                lambda: utils.make_api_request(
+                    "/skills/search", {"q": "test"}, api_key="test_key", timeout=5
+                ),
+                5,
+            ),
+        ],
+        ids=["search_skills", "ai_search", "custom_timeout"],
+    )
+    def test_api_request_success(self, mock_response, call, expected_timeout):
+        """Test successful API calls and the timeout passed to requests"""
+        self.mock_get.return_value = mock_response
+
+        result = call()
 
         assert result["success"] is True
         assert len(result["data"]["skills"]) == 2
+        self.mock_get.assert_called_once()
+        assert self.mock_get.call_args[1]["timeout"] == (
+            utils.CONNECT_TIMEOUT,
+            expected_timeout,
+        )
+
+    def test_short_timeout_caps_connect_timeout(self, mock_response):
+        """Test that the connect timeout never exceeds the read timeout"""
+        self.mock_get.return_value = mock_response
+
+        utils.make_api_request(
+            "/skills/search", {"q": "fast"}, api_key="test_key", timeout=2
+        )
+        assert self.mock_get.call_args[1]["timeout"] == (2, 2)
+
+    def test_search_skills_error_401(self):
+        """Test API authentication error handling"""
+        self.mock_get.return_value = _http_response(
+            401,
+            json.dumps(
+                {
+                    "success": False,
+                    "error": {"code": "INVALID_API_KEY", "message": "Invalid key"},
+                }
+            ).encode(),
+        )
+
+        with pytest.raises(APIRequestError, match="authentication failed: Invalid key"):
+            search_skills.search_skills("test", api_key="invalid_key")
+
+    def test_search_skills_error_401_non_json_body(self):
+        """Test that a non-JSON 401 body still reports an authentication error"""
+        self.mock_get.return_value = _http_response(401, b"<html>Unauthorized</html>")
+
+        with pytest.raises(APIRequestError, match="authentication failed: Invalid API key"):
+            search_skills.search_skills("test", api_key="invalid_key")
+
+    def test_search_skills_http_error_truncates_body(self):
+        """Test that other HTTP errors quote only the start of the response body"""
+        self.mock_get.return_value = _http_response(
+            502, b"<html>Bad gateway</html>" + b"x" * 10000
+        )
+
+        with pytest.raises(APIRequestError, match="HTTP error 502") as exc_info:
+            search_skills.search_skills("test", api_key="test_key")
+        assert "<html>Bad gateway</html>" in str(exc_info.value)
+        assert "x" * utils.ERROR_BODY_EXCERPT_SIZE not in str(exc_info.value)
+
+    def test_search_skills_timeout(self):
+        """Test request timeout handling"""
+        self.mock_get.side_effect = requests.exceptions.Timeout()
+
+        with pytest.raises(APIRequestError, match="timed out"):
+            search_skills.search_skills("test", api_key="test_key")
+
+
+class TestResponseCache:
+    """Test the on-disk API response cache"""
+
+    @patch("utils._SESSION.get")
+    def test_repeated_search_served_from_cache(self, mock_get, mock_response):
+        """Test that an identical search within the TTL skips the network"""
+        mock_get.return_value = mock_response
+
+        first = search_skills.search_skills("test", api_key="test_key")
+        second = search_skills.search_skills("test", api_key="test_key")
+
+        assert first == second
         mock_get.assert_called_once()
 
-    @patch("utils.requests.get")
-    def test_search_skills_with_timeout(self, mock_get, mock_api_response):
-        """Test that timeout is passed to requests"""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status = Mock()
+    @patch("utils._SESSION.get")
+    def test_cache_is_per_api_key(self, mock_get, mock_response):
+        """Test that a response cached for one API key is not served to another"""
         mock_get.return_value = mock_response
 
-        search_skills.search_skills("test", api_key="test_key")
+        search_skills.search_skills("test", api_key="first_key")
+        search_skills.search_skills("test", api_key="second_key")
 
-        # Check that timeout was passed
-        call_kwargs = mock_get.call_args[1]
-        assert "timeout" in call_kwargs
-        assert call_kwargs["timeout"] == 10
+        assert mock_get.call_count == 2
+        assert "first_key" not in utils.CACHE_FILE.read_text()
 
-    @patch("utils.requests.get")
-    def test_search_skills_with_custom_timeout(self, mock_get, mock_api_response):
-        """Test custom timeout parameter"""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status = Mock()
+    @patch("utils._SESSION.get")
+    def test_cached_result_not_shared(self, mock_get, mock_response):
+        """Test that mutating a returned result does not alter the cache"""
         mock_get.return_value = mock_response
 
-        utils.make_api_request(
-            "/skills/search", {"q": "test"}, api_key="test_key", timeout=5
-        )
+        first = search_skills.search_skills("test", api_key="test_key")
+        expected = json.loads(json.dumps(first))
+        first["data"] = "changed"
 
-        call_kwargs = mock_get.call_args[1]
-        assert call_kwargs["timeout"] == 5
+        assert search_skills.search_skills("test", api_key="test_key") == expected
+        mock_get.assert_called_once()
 
-    @patch("utils.requests.get")
-    def test_search_skills_error_401(self, mock_get):
-        """Test API authentication error handling"""
-        mock_response = Mock()
-        mock_response.status_code = 401
-        mock_response.json.return_value = {
-            "success": False,
-            "error": {"code": "INVALID_API_KEY", "message": "Invalid key"},
-        }
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError()
+    @patch("utils._SESSION.get")
+    def test_batched_cache_writes_once(self, mock_get, mock_response):
+        """Test that a batch of requests reads and writes the cache file once"""
         mock_get.return_value = mock_response
 
-        with pytest.raises(APIRequestError, match="authentication failed"):
-            search_skills.search_skills("test", api_key="invalid_key")
+        with patch("utils.write_cache", wraps=utils.write_cache) as mock_write:
+            with utils.batched_cache_writes():
+                search_skills.search_skills("first", api_key="test_key")
+                search_skills.search_skills("second", api_key="test_key")
+                search_skills.search_skills("first", api_key="test_key")
+                assert not utils.CACHE_FILE.exists()
+
+        assert mock_get.call_count == 2
+        mock_write.assert_called_once()
+        assert len(utils.read_cache()) == 2
+
+    def test_cache_file_parsed_only_when_changed(self):
+        """Test that the cache is re-read from disk only after the file changes"""
+        entry = {"expires": 0, "data": {"success": True}}
+        utils.write_cache({"first": entry})
+
+        with patch("utils.json_loads", wraps=utils.json_loads) as mock_loads:
+            assert list(utils.read_cache()) == ["first"]
+            mock_loads.assert_not_called()
+
+            utils.CACHE_FILE.write_text(json.dumps({"first": entry, "second": entry}))
+            assert sorted(utils.read_cache()) == ["first", "second"]
+            mock_loads.assert_called_once()
+
+    def test_failed_cache_write_keeps_previous_file(self):
+        """Test that an interrupted write leaves the old cache intact"""
+        entry = {"expires": 0, "data": {"success": True}}
+        utils.write_cache({"first": entry})
+        before = utils.CACHE_FILE.read_bytes()
+
+        with patch("utils.os.replace", side_effect=OSError("disk full")):
+            utils.write_cache({"second": entry})
+
+        assert utils.CACHE_FILE.read_bytes() == before
+        assert list(utils.CACHE_FILE.parent.iterdir()) == [utils.CACHE_FILE]
+
+    @patch("utils._SESSION.get")
+    def test_no_cache_bypasses_cached_response(self, mock_get, mock_response):
+        """Test that use_cache=False always queries the API"""
+        mock_get.return_value = mock_response
 
-    @patch("utils.requests.get")
-    def test_search_skills_timeout(self, mock_get):
-        """Test request timeout handling"""
-        mock_get.side_effect = requests.exceptions.Timeout()
+        ai_search.ai_search("query", api_key="test_key")
+        ai_search.ai_search("query", api_key="test_key", use_cache=False)
 
-        with pytest.raises(APIRequestError, match="timed out"):
+        assert mock_get.call_count == 2
+
+    @patch("utils._SESSION.get")
+    def test_expired_entry_is_refreshed(self, mock_get, mock_response):
+        """Test that entries past their TTL are fetched again"""
+        mock_get.return_value = mock_response
+
+        utils.make_api_request("/skills/search", {"q": "test"}, api_key="k", cache_ttl=60)
+        cache = utils.read_cache()
+        for entry in cache.values():
+            entry["expires"] = 0
+        utils.write_cache(cache)
+        utils.make_api_request("/skills/search", {"q": "test"}, api_key="k", cache_ttl=60)
+
+        assert mock_get.call_count == 2
+
+    @patch("utils._SESSION.get")
+    def test_expired_entry_revalidated_with_etag(self, mock_get, mock_api_response):
+        """Test that a 304 reply to a conditional request reuses the cached body"""
+        first = Mock()
+        first.status_code = 200
+        first.content = json.dumps(mock_api_response).encode()
+        first.headers = {"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+        not_modified = Mock()
+        not_modified.status_code = 304
+        not_modified.content = b""
+        not_modified.headers = {"ETag": '"v1"'}
+        mock_get.side_effect = [first, not_modified, not_modified]
+
+        utils.make_api_request("/skills/search", {"q": "test"}, api_key="k")
+        for _ in range(2):
+            result = utils.make_api_request(
+                "/skills/search", {"q": "test"}, api_key="k", use_cache=False
+            )
+
+            # Validators the 304 did not resend are kept for the next revalidation
+            assert result == mock_api_response
+            headers = mock_get.call_args[1]["headers"]
+            assert headers["If-None-Match"] == '"v1"'
+            assert headers["If-Modified-Since"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class TestRateLimiter:
+    """Test request rate limiting"""
+
+    def test_burst_within_capacity_does_not_wait(self):
+        """Test that requests up to the bucket capacity go through immediately"""
+        limiter = utils.RateLimiter(rate=10, capacity=3)
+        with patch("utils.time.sleep") as mock_sleep:
+            for _ in range(3):
+                limiter.acquire()
+        mock_sleep.assert_not_called()
+
+    def test_excess_requests_wait_for_token(self):
+        """Test that a request beyond the capacity waits for the next token"""
+        limiter = utils.RateLimiter(rate=10, capacity=1)
+        with patch("utils.time.sleep") as mock_sleep:
+            limiter.acquire()
+            limiter.acquire()
+        mock_sleep.assert_called_once()
+        assert 0 < mock_sleep.call_args[0][0] <= 0.1
+
+    @patch("utils._SESSION.get")
+    def test_cache_hits_are_not_rate_limited(self, mock_get, mock_response):
+        """Test that only requests sent to the API consume tokens"""
+        mock_get.return_value = mock_response
+
+        with patch.object(utils._RATE_LIMITER, "acquire") as mock_acquire:
             search_skills.search_skills("test", api_key="test_key")
+            search_skills.search_skills("test", api_key="test_key")
+
+        mock_acquire.assert_called_once()
+
 
-    @patch("utils.requests.get")
-    def test_ai_search_success(self, mock_get, mock_api_response):
-        """Test successful AI semantic search"""
+class TestJSONHelpers:
+    """Test JSON parsing and output helpers"""
+
+    def test_json_round_trip(self, mock_api_response):
+        """Test that dumped output parses back to the same data"""
+        output = utils.json_dumps(mock_api_response)
+        assert utils.json_loads(output.encode("utf-8")) == mock_api_response
+
+    def test_json_dumps_without_orjson(self, mock_api_response, monkeypatch):
+        """Test the stdlib fallback when orjson is not installed"""
+        monkeypatch.setattr(utils, "orjson", None)
+        output = utils.json_dumps(mock_api_response)
+        assert '\n  "success": true' in output
+        assert json.loads(output) == mock_api_response
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_print_json(self, mock_api_response, monkeypatch, capsys, use_orjson):
+        """Test that JSON output follows earlier text, with or without orjson"""
+        if not use_orjson:
+            monkeypatch.setattr(utils, "orjson", None)
+
+        print("header")
+        utils.print_json(mock_api_response)
+
+        header, body = capsys.readouterr().out.split("\n", 1)
+        assert header == "header"
+        assert body.endswith("}\n")
+        assert json.loads(body) == mock_api_response
+
+    @pytest.mark.parametrize("encoding", ["cp1252", "UTF8"])
+    def test_ensure_utf8_output_on_windows(self, monkeypatch, encoding):
+        """Test that legacy Windows console encodings are switched to UTF-8"""
+        stream = io.TextIOWrapper(io.BytesIO(), encoding=encoding)
+        monkeypatch.setattr(sys, "platform", "win32")
+        monkeypatch.setattr(sys, "stdout", stream)
+
+        with patch.object(stream, "reconfigure", wraps=stream.reconfigure) as reconfigure:
+            utils.ensure_utf8_output()
+
+        assert codecs.lookup(stream.encoding).name == "utf-8"
+        assert reconfigure.called == (encoding == "cp1252")
+
+    @patch("utils._SESSION.get")
+    def test_invalid_json_raises_api_error(self, mock_get):
+        """Test that a non-JSON body is reported as an API error"""
         mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
+        mock_response.content = b"<html>Bad Gateway</html>"
         mock_response.raise_for_status = Mock()
         mock_get.return_value = mock_response
 
-        result = ai_search.ai_search("How to create a scraper", api_key="test_key")
-
-        assert result["success"] is True
-        assert len(result["data"]["skills"]) == 2
+        with pytest.raises(APIRequestError, match="Invalid JSON"):
+            search_skills.search_skills("test", api_key="test_key")
 
 
 class TestResultFormatting:
     """Test result formatting functions"""
 
-    def test_format_results_success(self, mock_api_response, capsys):
+    def test_truncate_text(self):
+        """Test that only text over the limit is shortened"""
+        assert utils.truncate_text("a" * 100) == "a" * 100
+        assert utils.truncate_text("a" * 101) == "a" * 100 + "..."
+        assert utils.truncate_text("abcdef", limit=3) == "abc..."
+
+    def test_format_results_success(self, mock_api_response):
         """Test successful result formatting"""
-        search_skills.format_results(mock_api_response)
-        captured = capsys.readouterr()
+        buf = io.StringIO()
+        search_skills.format_results(mock_api_response, file=buf)
+        output = buf.getvalue()
 
-        assert "Test Skill" in captured.out
-        assert "Test Author" in captured.out
-        assert "42" in captured.out  # stars
+        assert "Test Skill" in output
+        assert "Test Author" in output
+        assert "42" in output  # stars
 
-    def test_format_results_error(self, mock_api_error_response, capsys):
+    def test_format_results_error(self, mock_api_error_response):
         """Test error result formatting"""
-        search_skills.format_results(mock_api_error_response)
-        captured = capsys.readouterr()
+        buf = io.StringIO()
+        search_skills.format_results(mock_api_error_response, file=buf)
+        output = buf.getvalue()
+
+        assert "Error" in output
+        assert "INVALID_API_KEY" in output
+
+    def test_format_skill_details(self, capsys):
+        """Test that skill details are printed with optional sections"""
+        skill_info.format_skill_details(
+            {
+                "name": "Test Skill",
+                "author": "Test Author",
+                "repository_url": "https://github.com/test/skill",
+                "examples": ["first", "second"],
+            }
+        )
+        out = capsys.readouterr().out
 
-        assert "Error" in captured.out
-        assert "INVALID_API_KEY" in captured.out
+        assert "📦 Test Skill" in out
+        assert "npx skills add test/skill" in out
+        assert "   2. second" in out
+        assert "Requirements" not in out
+        assert out.endswith("=" * 60 + "\n\n")
 
-    def test_ai_format_results_success(self, mock_api_response, capsys):
+    def test_ai_format_results_success(self, mock_api_response):
         """Test AI search result formatting"""
-        ai_search.format_results(mock_api_response)
-        captured = capsys.readouterr()
+        buf = io.StringIO()
+        ai_search.format_results(mock_api_response, file=buf)
+        output = buf.getvalue()
 
-        assert "AI Search Results" in captured.out
-        assert "Test Skill" in captured.out
-        assert "0.95" in captured.out  # relevance score
+        assert "AI Search Results" in output
+        assert "Test Skill" in output
+        assert "0.95" in output  # relevance score
 
-    def test_ai_format_results_empty(self, capsys):
+    def test_ai_format_results_empty(self):
         """Test AI search with no results"""
         empty_response = {"success": True, "data": {"skills": []}}
-        ai_search.format_results(empty_response)
-        captured = capsys.readouterr()
+        buf = io.StringIO()
+        ai_search.format_results(empty_response, file=buf)
+        output = buf.getvalue()
 
-        assert "No skills found" in captured.out
+        assert "No skills found" in output
 
 
 class TestIntegration:
     """Integration tests with utils module"""
 
-    @patch("utils.requests.get")
+    @pytest.fixture(autouse=True)
+    def _patch_session_get(self):
+        """Patch the shared session's get for every test in the class"""
+        with patch("utils._SESSION.get") as mock_get:
+            self.mock_get = mock_get
+            yield
+
     def test_search_without_api_key_uses_utils_loader(
-        self, mock_get, mock_api_response, monkeypatch
+        self, mock_response, monkeypatch
     ):
         """Test that search uses utils.load_api_key when no key provided"""
         # Set up API key in environment
         monkeypatch.setenv("SKILLSMP_API_KEY", "env_key_123")
 
-        mock_response = Mock()
-        mock_response.json.return_value = mock_api_response
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        self.mock_get.return_value = mock_response
 
         # Call without api_key parameter
         result = search_skills.search_skills("test")
@@ -264,42 +604,147 @@ class TestIntegration:
         # Verify the request was made
         assert result["success"] is True
         # Check that the Authorization header was set
-        call_args = mock_get.call_args
+        call_args = self.mock_get.call_args
         headers = call_args[1]["headers"]
         assert "Bearer env_key_123" in headers["Authorization"]
 
 
+class TestInstalledSkills:
+    """Test installing and listing skills in the skills directory"""
+
+    def test_skills_dir_is_cached(self, tmp_path, monkeypatch):
+        """Test that the skills directory is looked up once per process"""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        monkeypatch.setenv("USERPROFILE", str(tmp_path))
+
+        first = utils.get_claude_skills_dir()
+        with patch("utils.Path.home") as mock_home:
+            assert utils.get_claude_skills_dir() == first
+            mock_home.assert_not_called()
+        assert first == tmp_path / ".claude" / "skills"
+
+    def test_list_installed_skills(self, tmp_path):
+        """Test that only directories containing SKILL.md are listed, sorted"""
+        for name in ("zeta-skill", "alpha-skill"):
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "SKILL.md").write_text(f"---\nname: {name}\n---\n")
+        (tmp_path / "not-a-skill").mkdir()
+        (tmp_path / "README.md").write_text("not a skill")
+
+        assert utils.list_installed_skills(tmp_path) == ["alpha-skill", "zeta-skill"]
+        assert utils.list_installed_skills(tmp_path / "missing") == []
+
+    def test_install_skill_extracts_archive(self, tmp_path, capsys):
+        """Test that a .skill archive is extracted into the skills directory"""
+        skill_file = tmp_path / "my-skill.skill"
+        with zipfile.ZipFile(skill_file, "w") as zf:
+            zf.writestr("my-skill/", "")
+            zf.writestr("my-skill/SKILL.md", "---\nname: my-skill\n---\n")
+            zf.writestr("my-skill/scripts/run.py", "print('hi')\n")
+            zf.writestr("my-skill/empty.txt", "")
+        skills_dir = tmp_path / "skills"
+
+        installed = utils.install_skill(skill_file, skills_dir=skills_dir)
+
+        assert installed == skills_dir / "my-skill"
+        assert (installed / "scripts" / "run.py").read_text() == "print('hi')\n"
+        assert (installed / "empty.txt").read_bytes() == b""
+        assert utils.list_installed_skills(skills_dir) == ["my-skill"]
+
+    def test_install_skill_archive_reuses_open_zipfile(self, tmp_path, capsys):
+        """Test that an already opened ZipFile is installed and left open"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("zip-skill/SKILL.md", "---\nname: zip-skill\n---\n")
+
+        with zipfile.ZipFile(buffer) as zip_ref:
+            installed = utils.install_skill_archive(zip_ref, skills_dir=tmp_path)
+            assert zip_ref.fp is not None
+
+        assert (installed / "SKILL.md").is_file()
+
+    @patch("utils._SESSION.get")
+    def test_install_skill_from_url_in_memory(self, mock_get, tmp_path, capsys):
+        """Test that a downloaded skill is installed without a temporary file"""
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("url-skill/SKILL.md", "---\nname: url-skill\n---\n")
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw = io.BytesIO(buffer.getvalue())
+        mock_get.return_value = mock_response
+
+        with patch("utils.download_file") as mock_download_file:
+            installed = utils.install_skill_from_url(
+                "https://example.com/url-skill.skill", skills_dir=tmp_path
+            )
+
+        mock_download_file.assert_not_called()
+        assert (installed / "SKILL.md").exists()
+
+    @patch("utils._SESSION.get")
+    def test_large_download_spills_to_temp_file(self, mock_get, monkeypatch):
+        """Test that a download over ARCHIVE_SPOOL_SIZE moves to a seekable temp file"""
+        monkeypatch.setattr(utils, "ARCHIVE_SPOOL_SIZE", 8)
+        monkeypatch.setattr(utils, "DOWNLOAD_CHUNK_SIZE", 4)
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw = io.BytesIO(b"0123456789abcdef")
+        mock_get.return_value = mock_response
+
+        with utils.download_to_buffer("https://example.com/big.skill") as buffer:
+            assert not isinstance(buffer, io.BytesIO)
+            assert buffer.seekable()
+            assert buffer.read() == b"0123456789abcdef"
+
+    def test_install_skill_rejects_path_traversal(self, tmp_path):
+        """Test that archive members cannot escape the skills directory"""
+        skill_file = tmp_path / "evil.skill"
+        with zipfile.ZipFile(skill_file, "w") as zf:
+            zf.writestr("../escaped.txt", "nope")
+
+        with pytest.raises(utils.SkillsMPError, match="Unsafe path"):
+            utils.install_skill(skill_file, skills_dir=tmp_path / "skills")
+        assert not (tmp_path / "escaped.txt").exists()
+
+
 class TestSkillUpdateChecker:
     """Test skill update checking functionality"""
 
-    def test_extract_skill_name_from_md(self, tmp_path):
+    def test_extract_skill_name_from_md(self, make_skill):
         """Test extracting skill name from SKILL.md"""
-        import check_updates
-
-        # Create a test SKILL.md file
-        skill_md = tmp_path / "SKILL.md"
-        skill_md.write_text(
-            "---\nname: test-skill\nauthor: Test Author\n---\n\n# Test Skill\n"
+        skill_dir = make_skill(
+            content="---\nname: test-skill\nauthor: Test Author\n---\n\n# Test Skill\n"
         )
+        skill_md = skill_dir / "SKILL.md"
 
         name = check_updates.get_skill_name_from_md(skill_md)
         assert name == "test-skill"
 
-    def test_extract_skill_name_no_frontmatter(self, tmp_path):
+    def test_extract_skill_name_no_frontmatter(self, make_skill):
         """Test handling SKILL.md without frontmatter"""
-        import check_updates
-
-        skill_md = tmp_path / "SKILL.md"
-        skill_md.write_text("# Test Skill\n\nNo frontmatter here")
+        skill_md = make_skill(content="# Test Skill\n\nNo frontmatter here") / "SKILL.md"
 
         name = check_updates.get_skill_name_from_md(skill_md)
         assert name is None
 
+    def test_installed_skills_metadata_skips_non_skills(self, tmp_path):
+        """Test that only directories with a named SKILL.md are reported"""
+        (tmp_path / "notes.txt").write_text("not a skill")
+        (tmp_path / "empty-dir").mkdir()
+        (tmp_path / "unnamed").mkdir()
+        (tmp_path / "unnamed" / "SKILL.md").write_text("# No frontmatter\n")
+        (tmp_path / "real").mkdir()
+        (tmp_path / "real" / "SKILL.md").write_text("---\nname: real-skill\n---\n")
+
+        skills = check_updates.get_installed_skills_with_metadata(tmp_path)
+
+        assert [s["name"] for s in skills] == ["real-skill"]
+        assert skills[0]["path"] == tmp_path / "real"
+
     @patch("check_updates.make_api_request")
     def test_search_skill_on_skillsmp_success(self, mock_get):
         """Test successful skill search on SkillsMP"""
-        import check_updates
-
         mock_response = {
             "success": True,
             "data": {
@@ -325,11 +770,21 @@ class TestSkillUpdateChecker:
         assert result["name"] == "test-skill"
         assert result["updatedAt"] == 1704067200
 
+    @patch("check_updates.make_api_request")
+    def test_search_skill_on_skillsmp_prefers_exact_match(self, mock_get):
+        """Test that a case-insensitive exact name match beats the top result"""
+        mock_get.return_value = {
+            "success": True,
+            "data": {"skills": [{"name": "test-skill-pro"}, {"name": "Test-Skill"}]},
+        }
+
+        result = check_updates.search_skill_on_skillsmp("test-skill")
+
+        assert result == {"name": "Test-Skill"}
+
     @patch("check_updates.make_api_request")
     def test_search_skill_on_skillsmp_not_found(self, mock_get):
         """Test skill search when skill not found"""
-        import check_updates
-
         mock_response = {"success": True, "data": {"skills": []}}
         mock_get.return_value = mock_response
 
@@ -337,10 +792,40 @@ class TestSkillUpdateChecker:
 
         assert result is None
 
+    @patch("check_updates.search_skill_on_skillsmp")
+    def test_batch_search_deduplicates_names(self, mock_search):
+        """Test that names differing only in case are looked up once"""
+        mock_search.side_effect = lambda name, **kwargs: {"name": name}
+
+        result = check_updates.search_skills_on_skillsmp(["PDF-Tool", "pdf-tool", "seo"])
+
+        assert mock_search.call_count == 2
+        assert set(result) == {"pdf-tool", "seo"}
+
+    @patch("check_updates.search_skill_on_skillsmp")
+    def test_batch_search_reports_results_as_they_finish(self, mock_search):
+        """Test that a slow lookup does not hold back reporting of a fast one"""
+        fast_reported = threading.Event()
+
+        def fake_search(name, **kwargs):
+            if name == "slow":
+                assert fast_reported.wait(5)
+            return {"name": name}
+
+        def on_result(name, remote):
+            reported.append(name)
+            if name == "fast":
+                fast_reported.set()
+
+        mock_search.side_effect = fake_search
+        reported = []
+
+        check_updates.search_skills_on_skillsmp(["slow", "fast"], on_result=on_result)
+
+        assert reported == ["fast", "slow"]
+
     def test_format_timestamp(self):
         """Test timestamp formatting"""
-        import check_updates
-
         # Unix timestamp for 2024-01-01 00:00:00 UTC
         timestamp = 1704067200
         formatted = check_updates.format_timestamp(timestamp)
@@ -350,20 +835,17 @@ class TestSkillUpdateChecker:
     @patch("check_updates.search_skill_on_skillsmp")
     def test_check_skill_updates_with_update(self, mock_search, tmp_path):
         """Test update check when update is available"""
-        import check_updates
-        import os
-
-        # Create a test skills directory with an old skill
-        skills_dir = tmp_path / "skills"
-        skills_dir.mkdir()
-        skill_dir = skills_dir / "test-skill"
-        skill_dir.mkdir()
-        skill_md = skill_dir / "SKILL.md"
-        skill_md.write_text("---\nname: test-skill\n---\n")
-
-        # Set local modification time to 2023-12-31 (older than API response)
+        # A skill last modified 2023-12-31 (older than API response); the directory
+        # scan itself is covered by the metadata tests, so no files are needed here
         old_time = 1703980800  # 2023-12-31 00:00:00 UTC
-        os.utime(skill_dir, (old_time, old_time))
+        installed = [
+            {
+                "name": "test-skill",
+                "path": tmp_path / "test-skill",
+                "local_modified": old_time,
+                "local_modified_date": check_updates.format_timestamp(old_time),
+            }
+        ]
 
         # Mock API response with newer timestamp (2024-01-01)
         mock_search.return_value = {
@@ -374,7 +856,324 @@ class TestSkillUpdateChecker:
             "stars": 100,
         }
 
-        result = check_updates.check_skill_updates(skills_dir=skills_dir)
+        with patch(
+            "check_updates.get_installed_skills_with_metadata", return_value=installed
+        ):
+            result = check_updates.check_skill_updates(skills_dir=tmp_path)
 
         assert len(result["updates"]) == 1
         assert result["updates"][0]["name"] == "test-skill"
+
+    def test_parse_remote_timestamp(self):
+        """Test that updatedAt values are normalized before comparison"""
+        assert check_updates.parse_remote_timestamp(1704067200) == 1704067200.0
+        assert check_updates.parse_remote_timestamp("1704067200") == 1704067200.0
+        assert check_updates.parse_remote_timestamp(None) == 0.0
+        assert check_updates.parse_remote_timestamp("yesterday") == 0.0
+        assert check_updates.parse_remote_timestamp("nan") == 0.0
+
+    @patch("check_updates.search_skill_on_skillsmp")
+    def test_check_skill_updates_multiple_skills(self, mock_search, make_skill, tmp_path):
+        """Test that concurrent lookups keep results in scan order"""
+        for name in ("alpha-skill", "beta-skill", "gamma-skill"):
+            make_skill(name)
+        skills_dir = tmp_path / "skills"
+
+        # Only beta-skill exists on SkillsMP, with an old timestamp
+        mock_search.side_effect = lambda name, **kwargs: (
+            {"name": name, "updatedAt": 0} if name == "beta-skill" else None
+        )
+
+        result = check_updates.check_skill_updates(skills_dir=skills_dir, min_age=0)
+
+        assert mock_search.call_count == 3
+        assert [s["name"] for s in result["up_to_date"]] == ["beta-skill"]
+        assert sorted(s["name"] for s in result["not_found"]) == [
+            "alpha-skill",
+            "gamma-skill",
+        ]
+
+    def test_skill_name_survives_invalid_utf8(self, tmp_path):
+        """Test that stray non-UTF-8 bytes do not hide the skill name"""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_bytes(b"---\nname: latin-skill\ndescription: caf\xe9\n---\n")
+
+        assert check_updates.get_skill_name_from_md(skill_md) == "latin-skill"
+        assert check_updates.get_skill_name_from_md(tmp_path / "missing.md") is None
+
+    def test_extract_skill_name_after_long_field(self, tmp_path):
+        """Test that a name following several KB of frontmatter is still found"""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_text(f"---\ndescription: {'x' * 8000}\nname: late-skill\n---\n")
+
+        assert check_updates.get_skill_name_from_md(skill_md) == "late-skill"
+
+    @patch("check_updates.search_skill_on_skillsmp")
+    def test_check_skill_updates_skips_recently_modified(self, mock_search, make_skill):
+        """Test that freshly installed skills are not looked up on SkillsMP"""
+        skill_dir = make_skill("fresh-skill")
+
+        result = check_updates.check_skill_updates(skills_dir=skill_dir.parent)
+
+        mock_search.assert_not_called()
+        assert [s["name"] for s in result["skipped"]] == ["fresh-skill"]
+        assert result["up_to_date"] == []
+
+    @patch("utils._SESSION.get")
+    def test_update_details_served_from_check_cache(self, mock_get, tmp_path, capsys):
+        """Test that viewing details after an update check needs no new request"""
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text("---\nname: test-skill\n---\n")
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            {"success": True, "data": {"skills": [{"name": "test-skill", "updatedAt": 0}]}}
+        ).encode()
+        mock_response.headers = {}
+        mock_get.return_value = mock_response
+
+        check_updates.check_skill_updates(skills_dir=tmp_path, api_key="test_key", min_age=0)
+        skill_diff.show_skill_diff("test-skill", skill_dir=tmp_path, api_key="test_key")
+
+        mock_get.assert_called_once()
+
+
+class TestSkillDiff:
+    """Test comparing local skills with SkillsMP"""
+
+    def test_extract_frontmatter(self, tmp_path):
+        """Test that only fields inside the leading frontmatter block are parsed"""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_text(
+            "---\nname: test-skill\ndescription:  A test skill \n---\n"
+            "# Usage\nauthor: not frontmatter\n"
+        )
+
+        assert skill_diff.extract_frontmatter(skill_md) == {
+            "name": "test-skill",
+            "description": "A test skill",
+        }
+        assert skill_diff.extract_frontmatter(tmp_path / "missing.md") == {}
+
+    def test_extract_frontmatter_invalid_utf8(self, tmp_path):
+        """Test that the name is found the same way the update check finds it"""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_bytes(b"---\nname: latin-skill\nauthor: Jos\xe9\n---\n")
+
+        frontmatter = skill_diff.extract_frontmatter(skill_md)
+        assert frontmatter["name"] == check_updates.get_skill_name_from_md(skill_md)
+        assert frontmatter["author"] == "Jos\ufffd"
+
+    def test_extract_frontmatter_long_block(self, tmp_path):
+        """Test that frontmatter longer than a few KB is parsed in full"""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_text(
+            f"---\nname: long-skill\ndescription: {'x' * 8000}\nauthor: Someone\n---\n"
+        )
+
+        frontmatter = skill_diff.extract_frontmatter(skill_md)
+        assert len(frontmatter["description"]) == 8000
+        assert frontmatter["author"] == "Someone"
+
+    def test_extract_frontmatter_reparses_modified_file(self, tmp_path):
+        """Test that frontmatter is reused until SKILL.md changes"""
+        skill_md = tmp_path / "SKILL.md"
+        skill_md.write_text("---\nname: old-name\n---\n")
+        skill_diff.extract_frontmatter(skill_md)
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            assert skill_diff.extract_frontmatter(skill_md)["name"] == "old-name"
+            mock_open.assert_not_called()
+
+        skill_md.write_text("---\nname: renamed-skill\n---\n")
+        assert skill_diff.extract_frontmatter(skill_md)["name"] == "renamed-skill"
+
+    def test_find_local_skill_checks_named_directory_first(self, tmp_path):
+        """Test that a skill in its own-named directory is found with one parse"""
+        for dir_name, name in [("aaa", "other-skill"), ("my-skill", "my-skill")]:
+            (tmp_path / dir_name).mkdir()
+            (tmp_path / dir_name / "SKILL.md").write_text(f"---\nname: {name}\n---\n")
+        (tmp_path / "renamed").mkdir()
+        (tmp_path / "renamed" / "SKILL.md").write_text("---\nname: moved-skill\n---\n")
+
+        with patch(
+            "skill_diff.extract_frontmatter", wraps=skill_diff.extract_frontmatter
+        ) as mock_extract:
+            assert skill_diff.find_local_skill("my-skill", tmp_path) == tmp_path / "my-skill"
+        mock_extract.assert_called_once()
+
+        assert skill_diff.find_local_skill("Moved-Skill", tmp_path) == tmp_path / "renamed"
+        assert skill_diff.find_local_skill("missing", tmp_path) is None
+
+    def test_compare_versions_unchanged(self):
+        """Test that matching metadata yields no differences"""
+        local = {"name": "test-skill", "author": "Someone"}
+        remote = {"name": "test-skill", "author": "Someone", "stars": 7}
+
+        differences = skill_diff.compare_versions(local, remote)
+
+        assert differences["fields"] == []
+        assert differences["stars_changed"] is False
+
+    def test_show_skill_diff_not_installed(self, tmp_path, capsys):
+        """Test that a skill missing locally is reported without an API call"""
+        with patch("skill_diff.get_skill_details_from_skillsmp") as mock_details:
+            found = skill_diff.show_skill_diff("missing-skill", skill_dir=tmp_path)
+
+        assert found is False
+        mock_details.assert_not_called()
+        assert "not found locally" in capsys.readouterr().out
+
+    @patch("skill_diff.get_skill_details_from_skillsmp")
+    def test_show_skill_diff_reports_changes(self, mock_details, tmp_path, capsys):
+        """Test that differing frontmatter fields are displayed"""
+        skill_dir = tmp_path / "test-skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(
+            "---\nname: test-skill\nauthor: Old Author\n---\n"
+        )
+        mock_details.return_value = {
+            "name": "test-skill",
+            "author": "New Author",
+            "stars": 7,
+        }
+
+        found = skill_diff.show_skill_diff("test-skill", skill_dir=tmp_path)
+
+        assert found is True
+        output = capsys.readouterr().out
+        assert "Old Author" in output
+        assert "New Author" in output
+
+
+class TestSkillDownloader:
+    """Test installing skill updates over an existing installation"""
+
+    @staticmethod
+    def _install_old_skill(skills_dir):
+        skill_dir = skills_dir / "my-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("---\nname: my-skill\n---\nold\n")
+        return skill_dir
+
+    @staticmethod
+    def _skill_archive(url):
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as zf:
+            zf.writestr("my-skill/SKILL.md", "---\nname: my-skill\n---\nnew\n")
+        buffer.seek(0)
+        return buffer
+
+    def test_update_replaces_skill_and_drops_backup(self, tmp_path, capsys):
+        """Test that a successful update leaves only the new version"""
+        skill_dir = self._install_old_skill(tmp_path)
+
+        with patch(
+            "skill_downloader.download_skill_archive", side_effect=self._skill_archive
+        ):
+            ok = skill_downloader.install_skill_update(
+                "my-skill", download_url="https://example.com/x.skill", skills_dir=tmp_path
+            )
+
+        assert ok is True
+        assert (skill_dir / "SKILL.md").read_text().endswith("new\n")
+        assert not (tmp_path / "my-skill.backup").exists()
+
+    @patch("utils._SESSION.get")
+    def test_update_installs_downloaded_buffer(self, mock_get, tmp_path, capsys):
+        """Test that the buffer download_to_buffer returns can be opened as a zip"""
+        skill_dir = self._install_old_skill(tmp_path)
+        mock_response = MagicMock()
+        mock_response.__enter__.return_value = mock_response
+        mock_response.raw = self._skill_archive("https://example.com/x.skill")
+        mock_get.return_value = mock_response
+
+        ok = skill_downloader.install_skill_update(
+            "my-skill", download_url="https://example.com/x.skill", skills_dir=tmp_path
+        )
+
+        assert ok is True
+        assert (skill_dir / "SKILL.md").read_text().endswith("new\n")
+
+    def test_failed_install_restores_backup(self, tmp_path, capsys):
+        """Test that the moved-aside skill is put back if installation fails"""
+        skill_dir = self._install_old_skill(tmp_path)
+
+        with patch(
+            "skill_downloader.download_skill_archive", side_effect=self._skill_archive
+        ), patch("skill_downloader.install_skill_archive", side_effect=OSError("disk full")):
+            ok = skill_downloader.install_skill_update(
+                "my-skill", download_url="https://example.com/x.skill", skills_dir=tmp_path
+            )
+
+        assert ok is False
+        assert (skill_dir / "SKILL.md").read_text().endswith("old\n")
+        assert not (tmp_path / "my-skill.backup").exists()
+
+    def test_failed_backup_removal_keeps_update(self, tmp_path, capsys):
+        """Test that a backup that cannot be deleted does not undo the update"""
+        skill_dir = self._install_old_skill(tmp_path)
+        backup_path = tmp_path / "my-skill.backup"
+        real_rmtree = skill_downloader.shutil.rmtree
+
+        def fake_rmtree(path, *args, **kwargs):
+            if str(path) == str(backup_path):
+                raise OSError("permission denied")
+            real_rmtree(path, *args, **kwargs)
+
+        with patch(
+            "skill_downloader.download_skill_archive", side_effect=self._skill_archive
+        ), patch("skill_downloader.shutil.rmtree", side_effect=fake_rmtree):
+            ok = skill_downloader.install_skill_update(
+                "my-skill", download_url="https://example.com/x.skill", skills_dir=tmp_path
+            )
+
+        assert ok is True
+        assert (skill_dir / "SKILL.md").read_text().endswith("new\n")
+        assert "Could not remove backup" in capsys.readouterr().out
+
+    def test_failed_download_keeps_skill_in_place(self, tmp_path, capsys):
+        """Test that nothing is moved when the download fails"""
+        skill_dir = self._install_old_skill(tmp_path)
+
+        with patch("skill_downloader.download_skill_archive", return_value=None):
+            ok = skill_downloader.install_skill_update(
+                "my-skill", download_url="https://example.com/x.skill", skills_dir=tmp_path
+            )
+
+        assert ok is False
+        assert (skill_dir / "SKILL.md").exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["my-skill"]
+
+    def test_infer_download_url_probes_candidates(self):
+        """Test that the first release asset that exists is chosen"""
+        github_url = "https://github.com/owner/repo/tree/main/skills/my-skill"
+        probed = []
+
+        def fake_exists(url):
+            probed.append(url)
+            return url.endswith("/repo.skill")
+
+        with patch("skill_downloader.url_exists", side_effect=fake_exists):
+            url = skill_downloader.infer_download_url(github_url, "my-skill")
+
+        assert url == "https://github.com/owner/repo/releases/latest/download/repo.skill"
+        assert len(probed) == 2
+
+        with patch("skill_downloader.url_exists", return_value=False) as mock_exists:
+            assert skill_downloader.infer_download_url(github_url, "repo") is None
+        assert mock_exists.call_count == 2
+
+    @patch("utils._SESSION")
+    def test_dry_run_lists_candidates_offline(self, mock_session, monkeypatch, capsys):
+        """Test that --dry-run prints the candidate URLs without probing them"""
+        github_url = "https://github.com/owner/repo/tree/main/skills/my-skill"
+        argv = ["skill_downloader", "my-skill", "--github-url", github_url, "--dry-run"]
+        monkeypatch.setattr(sys, "argv", argv)
+
+        skill_downloader.main()
+
+        assert not mock_session.method_calls
+        out = capsys.readouterr().out
+        for url in skill_downloader.candidate_download_urls(github_url, "my-skill"):
+            assert url in out